@@ -8,86 +8,203 @@ INSTRUCTIONS:
 4. Run this script: python analyze_manual_html.py
 """
 
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+import functools
+import io
+import mmap
 import os
+import re
+import sys
+
+
+# Candidate listing container selectors, compiled once at import
+SELECTORS = (
+    'article.placard',
+    'li.mortar-wrapper',
+    'div.property-item',
+    '[data-listingid]',
+    '[data-listing-id]',
+    'article',
+    'li.placard',
+    'div.placard',
+    '.property',
+    '.propertyCard',
+    '[class*="property"]',
+    '[class*="listing"]',
+)
+_COMPILED_SELECTORS = [(s, CSSSelector(s, translator='html')) for s in SELECTORS]
+
+# Bytes handed to the parser per feed() call when streaming the saved page
+PARSE_CHUNK_SIZE = 64 * 1024
+
+# Script output is collected here and written to stdout once per stage
+_out = io.StringIO()
+
+
+def _p(*args, **kwargs):
+    """Buffer a line of output; takes the same arguments as print()."""
+    print(*args, file=_out, **kwargs)
+
+
+def _flush():
+    """Write the buffered output to stdout in a single call."""
+    sys.stdout.write(_out.getvalue())
+    sys.stdout.flush()
+    _out.seek(0)
+    _out.truncate()
+
+
+def _buffered(func):
+    """Flush buffered output when the wrapped stage returns or raises."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _flush()
+    return wrapper
+
+
+def _class_token(name):
+    """Match elements with an exact class (like '.name')."""
+    return lambda elem, classes: name in classes.split()
+
+
+def _class_contains(text):
+    """Match elements whose class attribute contains text (like '[class*="text"]')."""
+    return lambda elem, classes: text in classes
+
+
+# Per-listing field rules: each field lists its matchers in priority order.
+# A single walk over the listing keeps the highest-priority match per field,
+# taking the first element in document order within the same priority.
+_FIELD_RULES = (
+    ('url', (lambda elem, classes: elem.tag == 'a' and 'apartments.com' in elem.get('href', ''),)),
+    ('title', (lambda elem, classes: (elem.tag in ('h2', 'h3')
+                                      or _class_token('property-title')(elem, classes)
+                                      or _class_token('property-name')(elem, classes)
+                                      or 'title' in classes),)),
+    ('price', (_class_token('price-range'), _class_token('rent'), _class_token('pricing'),
+               _class_contains('price'), _class_contains('rent'))),
+    ('beds', (_class_token('bed-range'), _class_token('beds'), _class_contains('bed'))),
+    ('baths', (_class_token('bath-range'), _class_token('baths'), _class_contains('bath'))),
+)
+
+# Class names worth listing when no container selector matches, as one
+# alternation so each class is scanned once
+_RELEVANT_CLASS_RE = re.compile('property|listing|apartment|card|placard', re.IGNORECASE)
+
+
+def _text(elem):
+    """Return the element's stripped text, matching BeautifulSoup's get_text(strip=True)."""
+    return ''.join(s.strip() for s in elem.itertext())
+
+
+def _extract_fields(listing):
+    """
+    Find the URL, title, price, beds, and baths elements in one walk below the listing.
+
+    Returns:
+        Dict of field name -> matched element, in _FIELD_RULES order.
+    """
+    best = {}  # field -> (priority, element)
+
+    for elem in listing.iterdescendants(etree.Element):
+        classes = elem.get('class', '')
+
+        for field, matchers in _FIELD_RULES:
+            current = best.get(field)
+            if current is not None and current[0] == 0:
+                continue
+
+            limit = current[0] if current is not None else len(matchers)
+            for priority, matches in enumerate(matchers[:limit]):
+                if matches(elem, classes):
+                    best[field] = (priority, elem)
+                    break
+
+        # Every field already has its top-priority match
+        if len(best) == len(_FIELD_RULES) and all(p == 0 for p, _ in best.values()):
+            break
+
+    return {field: best[field][1] for field, _ in _FIELD_RULES if field in best}
 
 
+@_buffered
 def analyze_manual_html():
     """Analyze manually saved HTML file."""
 
     if not os.path.exists('manual_page.html'):
-        print("=" * 80)
-        print("MANUAL HTML ANALYZER")
-        print("=" * 80)
-        print()
-        print("❌ File 'manual_page.html' not found!")
-        print()
-        print("INSTRUCTIONS:")
-        print("1. Open browser and visit:")
-        print("   https://www.apartments.com/chicago-il/")
-        print()
-        print("2. Save the page:")
-        print("   - Chrome: Ctrl+S / Cmd+S → Save as 'manual_page.html'")
-        print("   - Or right-click → 'View Page Source' → Copy all → Save to 'manual_page.html'")
-        print()
-        print("3. Place 'manual_page.html' in this directory")
-        print()
-        print("4. Run this script again")
+        _p("=" * 80)
+        _p("MANUAL HTML ANALYZER")
+        _p("=" * 80)
+        _p()
+        _p("❌ File 'manual_page.html' not found!")
+        _p()
+        _p("INSTRUCTIONS:")
+        _p("1. Open browser and visit:")
+        _p("   https://www.apartments.com/chicago-il/")
+        _p()
+        _p("2. Save the page:")
+        _p("   - Chrome: Ctrl+S / Cmd+S → Save as 'manual_page.html'")
+        _p("   - Or right-click → 'View Page Source' → Copy all → Save to 'manual_page.html'")
+        _p()
+        _p("3. Place 'manual_page.html' in this directory")
+        _p()
+        _p("4. Run this script again")
         return
 
-    print("=" * 80)
-    print("ANALYZING MANUAL HTML")
-    print("=" * 80)
-    print()
+    _p("=" * 80)
+    _p("ANALYZING MANUAL HTML")
+    _p("=" * 80)
+    _p()
 
-    with open('manual_page.html', 'r', encoding='utf-8') as f:
-        html = f.read()
+    # An empty file can't be mapped, and has nothing to analyze anyway
+    if os.path.getsize('manual_page.html') == 0:
+        _p("❌ 'manual_page.html' is empty!")
+        _p("   Save the page source into it again and rerun this script.")
+        return
 
-    print(f"✓ Loaded manual_page.html ({len(html):,} characters)")
-    print()
+    # Map the file instead of reading it into a string, and stream it into
+    # the parser so the page is never held twice in memory
+    parser = lxml.html.HTMLParser(encoding='utf-8')
+    with open('manual_page.html', 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = mm.size()
+        for offset in range(0, size, PARSE_CHUNK_SIZE):
+            parser.feed(mm[offset:offset + PARSE_CHUNK_SIZE])
+        tree = parser.close()
 
-    soup = BeautifulSoup(html, 'lxml')
+    _p(f"✓ Loaded manual_page.html ({size:,} bytes)")
+    _p()
 
     # Page title
-    title = soup.find('title')
-    print(f"Page Title: {title.get_text() if title else 'None'}")
-    print()
+    title = tree.find('.//title')
+    _p(f"Page Title: {title.text_content() if title is not None else 'None'}")
+    _p()
 
     # Test selectors
-    print("Testing CSS Selectors:")
-    print("=" * 80)
-
-    selectors = [
-        'article.placard',
-        'li.mortar-wrapper',
-        'div.property-item',
-        '[data-listingid]',
-        '[data-listing-id]',
-        'article',
-        'li.placard',
-        'div.placard',
-        '.property',
-        '.propertyCard',
-        '[class*="property"]',
-        '[class*="listing"]',
-    ]
+    _p("Testing CSS Selectors:")
+    _p("=" * 80)
 
     results = []
 
-    for selector in selectors:
-        elements = soup.select(selector)
+    for selector, compiled in _COMPILED_SELECTORS:
+        elements = compiled(tree)
         count = len(elements)
         results.append((selector, count, elements))
-        print(f"{selector:<35} → {count:>4} elements")
+        _p(f"{selector:<35} → {count:>4} elements")
 
         if 0 < count < 50 and elements:
             # Show sample of first element
             sample = elements[0]
-            classes = sample.get('class', [])
+            classes = sample.get('class', '').split()
             if classes:
-                print(f"  └─ Sample classes: {', '.join(classes[:3])}")
+                _p(f"  └─ Sample classes: {', '.join(classes[:3])}")
 
-    print()
+    _p()
 
     # Find best match
     best = [(s, c, e) for s, c, e in results if 0 < c < 100]
@@ -95,97 +212,61 @@ def analyze_manual_html():
         best.sort(key=lambda x: x[1], reverse=True)
         selector, count, elements = best[0]
 
-        print("=" * 80)
-        print(f"BEST MATCH: {selector} ({count} elements)")
-        print("=" * 80)
-        print()
+        _p("=" * 80)
+        _p(f"BEST MATCH: {selector} ({count} elements)")
+        _p("=" * 80)
+        _p()
 
         # Analyze first 3 listings
         for i, elem in enumerate(elements[:3], 1):
-            print(f"\nListing #{i}:")
-            print("-" * 80)
+            _p(f"\nListing #{i}:")
+            _p("-" * 80)
 
             # Try to extract information
             info = {}
-
-            # URL
-            link = elem.select_one('a[href*="apartments.com"]')
-            if link:
-                info['url'] = link.get('href', 'N/A')
-
-            # Title
-            title = elem.select_one('.property-title, .property-name, h2, h3, [class*="title"]')
-            if title:
-                info['title'] = title.get_text(strip=True)
-
-            # Price
-            price_selectors = ['.price-range', '.rent', '.pricing', '[class*="price"]', '[class*="rent"]']
-            for ps in price_selectors:
-                price = elem.select_one(ps)
-                if price:
-                    info['price'] = price.get_text(strip=True)
-                    break
-
-            # Beds
-            bed_selectors = ['.bed-range', '.beds', '[class*="bed"]']
-            for bs in bed_selectors:
-                beds = elem.select_one(bs)
-                if beds:
-                    info['beds'] = beds.get_text(strip=True)
-                    break
-
-            # Baths
-            bath_selectors = ['.bath-range', '.baths', '[class*="bath"]']
-            for bs in bath_selectors:
-                baths = elem.select_one(bs)
-                if baths:
-                    info['baths'] = baths.get_text(strip=True)
-                    break
+            for field, match in _extract_fields(elem).items():
+                info[field] = match.get('href', 'N/A') if field == 'url' else _text(match)
 
             # Display what we found
             for key, value in info.items():
-                print(f"  {key.capitalize()}: {value}")
+                _p(f"  {key.capitalize()}: {value}")
 
             if not info:
-                print("  ⚠️  Could not extract information")
-                print(f"  Element classes: {elem.get('class', [])}")
-                print(f"  Element HTML (first 200 chars):")
-                print(f"  {str(elem)[:200]}...")
-
-        print()
-        print("=" * 80)
-        print("RECOMMENDATIONS")
-        print("=" * 80)
-        print(f"\nUpdate scraper.py line ~111:")
-        print(f"  listing_containers = soup.select('{selector}')")
-        print()
-        print("Also check the selectors for:")
-        print("  - Price elements (class names containing 'price' or 'rent')")
-        print("  - Bedroom elements (class names containing 'bed')")
-        print("  - Bathroom elements (class names containing 'bath')")
-        print()
+                _p("  ⚠️  Could not extract information")
+                _p(f"  Element classes: {elem.get('class', '').split()}")
+                _p(f"  Element HTML (first 200 chars):")
+                _p(f"  {lxml.html.tostring(elem, encoding='unicode')[:200]}...")
+
+        _p()
+        _p("=" * 80)
+        _p("RECOMMENDATIONS")
+        _p("=" * 80)
+        _p(f"\nUpdate the listing container selector in src/scraper.py:")
+        _p(f"  _LISTING_CONTAINERS = _css('{selector}')")
+        _p()
+        _p("Also check the selectors for:")
+        _p("  - Price elements (class names containing 'price' or 'rent')")
+        _p("  - Bedroom elements (class names containing 'bed')")
+        _p("  - Bathroom elements (class names containing 'bath')")
+        _p()
 
     else:
-        print("❌ No suitable listing containers found!")
-        print()
-        print("Let's look at all unique class names:")
-        print("-" * 80)
+        _p("❌ No suitable listing containers found!")
+        _p()
+        _p("Let's look at all unique class names:")
+        _p("-" * 80)
 
         all_classes = set()
-        for elem in soup.find_all(class_=True):
-            classes = elem.get('class', [])
-            if isinstance(classes, list):
-                all_classes.update(classes)
+        for elem in tree.xpath('//*[@class]'):
+            all_classes.update(elem.get('class').split())
 
-        relevant = sorted([c for c in all_classes
-                          if any(keyword in c.lower()
-                                for keyword in ['property', 'listing', 'apartment', 'card', 'placard'])])
+        relevant = sorted(c for c in all_classes if _RELEVANT_CLASS_RE.search(c))
 
         for c in relevant[:30]:
-            print(f"  {c}")
+            _p(f"  {c}")
 
         if len(relevant) > 30:
-            print(f"  ... and {len(relevant) - 30} more")
+            _p(f"  ... and {len(relevant) - 30} more")
 
 
 if __name__ == '__main__':
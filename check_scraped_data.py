@@ -1,57 +1,148 @@
 """
 Quick script to check what data the scraper is actually extracting.
+
+Pass --json to also dump every scraped listing as JSON, or --save PATH to
+write them to a .parquet (requires pyarrow) or .csv file.
 """
 
+import argparse
+import csv
+import json
+import sys
+from collections import Counter
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # only needed for --save *.parquet
+    pa = pq = None
+
 from src.config import Config
 from src.scraper import ApartmentsScraper
 
-config = Config('config.json')
-scraper = ApartmentsScraper(config)
-
-print("Scraping first page to check data quality...")
-print("=" * 80)
-
-listings = scraper.scrape_listings(max_pages=1)
-
-print(f"\nTotal listings found: {len(listings)}")
-print("\nFirst 5 listings:")
-print("=" * 80)
-
-for i, listing in enumerate(listings[:5], 1):
-    print(f"\n#{i}:")
-    print(f"  Title: {listing.get('title', 'N/A')}")
-    print(f"  Address: {listing.get('address', 'N/A')}")
-    print(f"  Price: ${listing.get('price', 'N/A')}")
-    print(f"  Bedrooms: {listing.get('bedrooms', 'N/A')}")
-    print(f"  Bathrooms: {listing.get('bathrooms', 'N/A')}")
-    print(f"  URL: {listing.get('url', 'N/A')[:60]}...")
-
-print("\n" + "=" * 80)
-print("Data Quality Summary:")
-print("=" * 80)
-
-# Count how many have each field
-total = len(listings)
-has_price = sum(1 for l in listings if l.get('price'))
-has_beds = sum(1 for l in listings if l.get('bedrooms') is not None)
-has_baths = sum(1 for l in listings if l.get('bathrooms') is not None)
-
-print(f"Listings with price: {has_price}/{total} ({has_price/total*100:.0f}%)")
-print(f"Listings with bedrooms: {has_beds}/{total} ({has_beds/total*100:.0f}%)")
-print(f"Listings with bathrooms: {has_baths}/{total} ({has_baths/total*100:.0f}%)")
-
-# Show price and bedroom distribution
-prices = [l['price'] for l in listings if l.get('price')]
-beds = [l['bedrooms'] for l in listings if l.get('bedrooms') is not None]
-
-if prices:
-    print(f"\nPrice range: ${min(prices):,.0f} - ${max(prices):,.0f}")
-
-if beds:
-    from collections import Counter
-    bed_counts = Counter(beds)
-    print(f"\nBedroom distribution:")
-    for bed_count in sorted(bed_counts.keys()):
-        count = bed_counts[bed_count]
-        bed_label = "Studio" if bed_count == 0 else f"{int(bed_count) if bed_count.is_integer() else bed_count} bed"
-        print(f"  {bed_label}: {count} listings")
+
+def to_columns(listings):
+    """
+    Transpose listing dicts into one list per field.
+
+    Fields missing from a listing are filled with None so every column has
+    the same length.
+    """
+    fields = dict.fromkeys(field for listing in listings for field in listing)
+    return {field: [listing.get(field) for listing in listings] for field in fields}
+
+
+def summarize(columns):
+    """
+    Collect field coverage, price range, and bedroom distribution from columns.
+
+    Returns:
+        (has_price, has_beds, has_baths, min_price, max_price, bed_counts)
+    """
+    prices = [price for price in columns.get('price', ()) if price]
+    beds = [bed for bed in columns.get('bedrooms', ()) if bed is not None]
+    has_baths = sum(bath is not None for bath in columns.get('bathrooms', ()))
+
+    return (len(prices), len(beds), has_baths,
+            min(prices, default=None), max(prices, default=None), Counter(beds))
+
+
+def save_columns(columns, path):
+    """Write the columns to a Parquet file (needs pyarrow) or, otherwise, CSV."""
+    if path.endswith('.parquet'):
+        if pa is None:
+            raise SystemExit("Saving to Parquet requires pyarrow (pip install pyarrow)")
+        pq.write_table(pa.table(columns), path)
+        return
+
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(zip(*columns.values()))
+
+
+def dump_listings(listings):
+    """Write the listings to stdout as indented JSON."""
+    sys.stdout.flush()
+    if orjson:
+        sys.stdout.buffer.write(orjson.dumps(listings, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(listings, indent=2, default=str))
+
+
+def main():
+    """Scrape the first page and report what data was extracted."""
+    parser = argparse.ArgumentParser(description='Check the data the scraper extracts')
+    parser.add_argument('--json', action='store_true', help='Dump every scraped listing as JSON')
+    parser.add_argument('--save', metavar='PATH', help='Save the listings to a .parquet or .csv file')
+    args = parser.parse_args()
+
+    config = Config('config.json')
+    scraper = ApartmentsScraper(config)
+
+    print("Scraping first page to check data quality...")
+    print("=" * 80)
+
+    listings = scraper.scrape_listings(max_pages=1)
+
+    print(f"\nTotal listings found: {len(listings)}")
+    if not listings:
+        print("Nothing to check; the scraper may need adjustment.")
+        return
+
+    print("\nFirst 5 listings:")
+    print("=" * 80)
+
+    for i, listing in enumerate(listings[:5], 1):
+        print(f"\n#{i}:")
+        print(f"  Title: {listing.get('title', 'N/A')}")
+        print(f"  Address: {listing.get('address', 'N/A')}")
+        print(f"  Price: ${listing.get('price', 'N/A')}")
+        print(f"  Bedrooms: {listing.get('bedrooms', 'N/A')}")
+        print(f"  Bathrooms: {listing.get('bathrooms', 'N/A')}")
+        print(f"  URL: {listing.get('url', 'N/A')[:60]}...")
+
+    print("\n" + "=" * 80)
+    print("Data Quality Summary:")
+    print("=" * 80)
+
+    # Count how many have each field
+    total = len(listings)
+    columns = to_columns(listings)
+    has_price, has_beds, has_baths, min_price, max_price, bed_counts = summarize(columns)
+
+    print(f"Listings with price: {has_price}/{total} ({has_price/total*100:.0f}%)")
+    print(f"Listings with bedrooms: {has_beds}/{total} ({has_beds/total*100:.0f}%)")
+    print(f"Listings with bathrooms: {has_baths}/{total} ({has_baths/total*100:.0f}%)")
+
+    # Show price and bedroom distribution
+    if has_price:
+        print(f"\nPrice range: ${min_price:,.0f} - ${max_price:,.0f}")
+
+    if bed_counts:
+        print(f"\nBedroom distribution:")
+        for bed_count in sorted(bed_counts.keys()):
+            count = bed_counts[bed_count]
+            bed_label = "Studio" if bed_count == 0 else f"{int(bed_count) if bed_count.is_integer() else bed_count} bed"
+            print(f"  {bed_label}: {count} listings")
+
+    if args.json:
+        print("\n" + "=" * 80)
+        print("Scraped Listings (JSON):")
+        print("=" * 80)
+        dump_listings(listings)
+
+    if args.save:
+        save_columns(columns, args.save)
+        print(f"\nSaved {total} listings to {args.save}")
+
+
+if __name__ == '__main__':
+    main()
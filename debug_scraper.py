@@ -3,184 +3,412 @@ Debug script to analyze Apartments.com requests and responses.
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from lxml import etree
+from cssselect import HTMLTranslator
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import io
 import re
+import sys
+import threading
+import time
 from src.config import Config
-
-
+from src.slug import slugify
+
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+}
+
+# Number of pages probed per location and how many are fetched at once
+PROBE_PAGES = 3
+MAX_CONCURRENT_FETCHES = 8
+
+# Probe requests start at most REQUESTS_PER_SECOND times a second; 429/503
+# responses are retried with exponential backoff (or the server's Retry-After)
+REQUESTS_PER_SECOND = 4
+MAX_RETRIES = 5
+MAX_RETRY_DELAY = 60
+RETRY_STATUSES = (429, 503)
+
+# Listing container selectors to probe, compiled once at import
+SELECTORS_TO_TEST = (
+    'article.placard',
+    'li.mortar-wrapper',
+    'div.property-item',
+    '[data-listingid]',
+    '[data-listing-id]',
+    'article',
+    'li.placard',
+    'div.placard',
+    '.property',
+    '.propertyCard',
+    '[class*="property"]',
+    '[class*="listing"]',
+    '[class*="placard"]',
+)
+
+# Each selector is compiled as a self-axis test so elements can be matched
+# one at a time as the pull parser finishes them
+_translator = HTMLTranslator()
+_COMPILED_SELECTORS = [
+    (s, etree.XPath(_translator.css_to_xpath(s, prefix='self::')))
+    for s in SELECTORS_TO_TEST
+]
+
+# Streaming parse limits: input is capped and fed in fixed-size chunks,
+# and each selector stops counting after MAX_SAMPLES matches
+MAX_HTML_SIZE = 5 * 1024 * 1024
+PARSE_CHUNK_SIZE = 64 * 1024
+MAX_SAMPLES = 100
+
+# Property/listing related class names, as one alternation so each class
+# is scanned once
+_RELEVANT_CLASS_RE = re.compile('property|listing|apartment|placard|card|item', re.IGNORECASE)
+
+# Quoted class attribute values, read straight from the raw HTML
+_CLASS_ATTR_RE = re.compile(r'''(?<![\w-])class\s*=\s*(?:"([^"]*)"|'([^']*)')''', re.IGNORECASE)
+
+# Script output is collected here and written to stdout once per stage
+_out = io.StringIO()
+
+
+def _p(*args, **kwargs):
+    """Buffer a line of output; takes the same arguments as print()."""
+    print(*args, file=_out, **kwargs)
+
+
+def _flush():
+    """Write the buffered output to stdout in a single call."""
+    sys.stdout.write(_out.getvalue())
+    sys.stdout.flush()
+    _out.seek(0)
+    _out.truncate()
+
+
+def _buffered(func):
+    """Flush buffered output when the wrapped stage returns or raises."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _flush()
+    return wrapper
+
+
+@_buffered
 def test_url_building():
     """Test what URL is being generated."""
-    print("=" * 80)
-    print("TESTING URL BUILDING")
-    print("=" * 80)
+    _p("=" * 80)
+    _p("TESTING URL BUILDING")
+    _p("=" * 80)
 
     config = Config('config.json')
     location = config.location
 
     # Simulate the URL building logic
-    location_slug = location.lower()
-    location_slug = re.sub(r'[^\w\s-]', '', location_slug)
-    location_slug = re.sub(r'[\s_]+', '-', location_slug)
+    location_slug = slugify(location)
 
     url = f"https://www.apartments.com/{location_slug}/"
 
-    print(f"Location: {location}")
-    print(f"URL Slug: {location_slug}")
-    print(f"Full URL: {url}")
-    print()
+    _p(f"Location: {location}")
+    _p(f"URL Slug: {location_slug}")
+    _p(f"Full URL: {url}")
+    _p()
 
     return url
 
 
-def fetch_and_analyze(url):
-    """Fetch the page and analyze its structure."""
-    print("=" * 80)
-    print("FETCHING PAGE")
-    print("=" * 80)
+def build_probe_urls(url, pages=PROBE_PAGES):
+    """Build the search URL plus its pagination probes (/2/, /3/, ...)."""
+    return [url] + [f"{url}{page}/" for page in range(2, pages + 1)]
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` requests per `period` seconds."""
+
+    def __init__(self, rate, period=1.0):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may start."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                refill = (now - self._updated) * self.rate / self.period
+                self._tokens = min(self.rate, self._tokens + refill)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-    }
+                wait = (1 - self._tokens) * self.period / self.rate
+            time.sleep(wait)
 
+
+def _retry_delay(response, attempt):
+    """Seconds to wait before retrying, preferring the server's Retry-After."""
     try:
-        response = requests.get(url, headers=headers, timeout=30)
-        print(f"Status Code: {response.status_code}")
-        print(f"Response Size: {len(response.text)} characters")
-        print(f"Content-Type: {response.headers.get('Content-Type')}")
-        print()
+        delay = float(response.headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        delay = 2 ** attempt
+    return min(delay, MAX_RETRY_DELAY)
+
+
+def _read_body(response):
+    """Read a streamed response body, capped at MAX_HTML_SIZE bytes."""
+    chunks = []
+    size = 0
+    # iter_content transparently decompresses gzip/deflate bodies
+    for chunk in response.iter_content(chunk_size=PARSE_CHUNK_SIZE):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= MAX_HTML_SIZE:
+            break
+
+    return b''.join(chunks).decode(response.encoding or 'utf-8', errors='replace')
 
-        if response.status_code != 200:
-            print(f"❌ Non-200 status code!")
-            return None
 
-        return response.text
+def fetch_page(session, url, limiter=None):
+    """
+    Stream a single URL's body, stopping once MAX_HTML_SIZE bytes are read.
+
+    Rate-limited and overloaded responses (429/503) are retried up to
+    MAX_RETRIES times with backoff.
+
+    Returns:
+        (response, html, error)
+    """
+    try:
+        for attempt in range(MAX_RETRIES):
+            if limiter is not None:
+                limiter.acquire()
 
+            with session.get(url, timeout=30, stream=True) as response:
+                if response.status_code in RETRY_STATUSES and attempt < MAX_RETRIES - 1:
+                    delay = _retry_delay(response, attempt)
+                else:
+                    return response, _read_body(response), None
+
+            time.sleep(delay)
     except Exception as e:
-        print(f"❌ Error fetching page: {e}")
-        return None
+        return None, None, e
+
+
+@_buffered
+def fetch_and_analyze(urls):
+    """Fetch all probe URLs concurrently and return the first page's HTML."""
+    _p("=" * 80)
+    _p("FETCHING PAGES")
+    _p("=" * 80)
+
+    # One shared session so every probe reuses the same pooled connection;
+    # the network waits overlap instead of running back to back.
+    with requests.Session() as session:
+        session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_maxsize=MAX_CONCURRENT_FETCHES)
+        session.mount('https://', adapter)
+
+        limiter = RateLimiter(REQUESTS_PER_SECOND)
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+            results = list(executor.map(lambda u: fetch_page(session, u, limiter), urls))
+
+    html = None
+    for url, (response, body, error) in zip(urls, results):
+        _p(f"URL: {url}")
+
+        if error is not None:
+            _p(f"❌ Error fetching page: {error}")
+            _p()
+            continue
 
+        _p(f"Status Code: {response.status_code}")
+        _p(f"Response Size: {len(body)} characters")
+        _p(f"Content-Type: {response.headers.get('Content-Type')}")
+        _p()
 
+        if response.status_code != 200:
+            _p(f"❌ Non-200 status code!")
+            _p()
+            continue
+
+        if url == urls[0]:
+            html = body
+
+    return html
+
+
+def _scan_html(html, max_samples=MAX_SAMPLES):
+    """
+    Stream the HTML through a pull parser in a single pass.
+
+    Selectors are matched as each element starts, so counts and the first
+    match of each selector follow document order, as select() does. Each
+    selector stops counting at max_samples matches. Finished elements are
+    cleared as the parse goes, so the whole tree is never held at once.
+
+    Returns:
+        (title, counts, samples)
+    """
+    parser = etree.HTMLPullParser(events=('start', 'end'))
+    html = html[:MAX_HTML_SIZE]
+
+    title = None
+    counts = {selector: 0 for selector in SELECTORS_TO_TEST}
+    samples = {}
+    pending = {}  # open element -> selectors it is the first match for
+
+    for offset in range(0, len(html), PARSE_CHUNK_SIZE):
+        parser.feed(html[offset:offset + PARSE_CHUNK_SIZE])
+
+        for event, element in parser.read_events():
+            if event == 'start':
+                for selector, matches in _COMPILED_SELECTORS:
+                    if counts[selector] < max_samples and matches(element):
+                        counts[selector] += 1
+                        if counts[selector] == 1:
+                            pending.setdefault(element, []).append(selector)
+                continue
+
+            if element.tag == 'title' and title is None:
+                title = element.text or ''
+
+            # A sample is serialized once its element is complete
+            for selector in pending.pop(element, ()):
+                samples[selector] = (
+                    element.get('class', '').split(),
+                    etree.tostring(element, method='html', encoding='unicode')[:300]
+                )
+
+            # Drop finished content, unless an open sample still contains it
+            if not pending:
+                element.clear(keep_tail=True)
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+
+    parser.close()
+    return title, counts, samples
+
+
+def _relevant_classes(html):
+    """Collect property/listing related class names with one regex pass over the HTML."""
+    all_classes = set()
+    for double_quoted, single_quoted in _CLASS_ATTR_RE.findall(html[:MAX_HTML_SIZE]):
+        all_classes.update((double_quoted or single_quoted).split())
+
+    return [c for c in all_classes if _RELEVANT_CLASS_RE.search(c)]
+
+
+@_buffered
 def analyze_html_structure(html):
     """Analyze the HTML structure to find listing elements."""
-    print("=" * 80)
-    print("ANALYZING HTML STRUCTURE")
-    print("=" * 80)
+    _p("=" * 80)
+    _p("ANALYZING HTML STRUCTURE")
+    _p("=" * 80)
 
-    soup = BeautifulSoup(html, 'lxml')
+    title, counts, samples = _scan_html(html)
 
     # Save a sample of the HTML for inspection
     with open('debug_page_sample.html', 'w', encoding='utf-8') as f:
         f.write(html[:50000])  # First 50KB
-    print("✓ Saved first 50KB of HTML to: debug_page_sample.html")
-    print()
+    _p("✓ Saved first 50KB of HTML to: debug_page_sample.html")
+    _p()
 
     # Check page title
-    title = soup.find('title')
-    print(f"Page Title: {title.get_text() if title else 'None'}")
-    print()
+    _p(f"Page Title: {title if title is not None else 'None'}")
+    _p()
 
     # Try to find listing containers with various selectors
-    print("Testing different CSS selectors for listings:")
-    print("-" * 80)
-
-    selectors_to_test = [
-        'article.placard',
-        'li.mortar-wrapper',
-        'div.property-item',
-        '[data-listingid]',
-        '[data-listing-id]',
-        'article',
-        'li.placard',
-        'div.placard',
-        '.property',
-        '.propertyCard',
-        '[class*="property"]',
-        '[class*="listing"]',
-        '[class*="placard"]',
-    ]
+    _p("Testing different CSS selectors for listings:")
+    _p("-" * 80)
 
     found_any = False
-    for selector in selectors_to_test:
-        elements = soup.select(selector)
-        print(f"  {selector:<35} → Found {len(elements)} elements")
-        if len(elements) > 0 and not found_any:
+    for selector in SELECTORS_TO_TEST:
+        count = counts[selector]
+        suffix = "+" if count >= MAX_SAMPLES else ""
+        _p(f"  {selector:<35} → Found {count}{suffix} elements")
+        if count > 0 and not found_any:
             found_any = True
-            print(f"    ✓ First match! Sample classes: {elements[0].get('class', [])}")
-            print(f"    ✓ Sample element:")
-            print(f"    {str(elements[0])[:300]}...")
-            print()
+            sample_classes, sample_html = samples[selector]
+            _p(f"    ✓ First match! Sample classes: {sample_classes}")
+            _p(f"    ✓ Sample element:")
+            _p(f"    {sample_html}...")
+            _p()
 
     if not found_any:
-        print("\n❌ No listing elements found with standard selectors!")
-        print("    The page structure may have changed or may be JavaScript-rendered.")
+        _p("\n❌ No listing elements found with standard selectors!")
+        _p("    The page structure may have changed or may be JavaScript-rendered.")
 
-    print()
+    _p()
 
     # Check for common class names
-    print("Common class names in the HTML:")
-    print("-" * 80)
-    all_classes = set()
-    for element in soup.find_all(class_=True):
-        if isinstance(element.get('class'), list):
-            all_classes.update(element['class'])
+    _p("Common class names in the HTML:")
+    _p("-" * 80)
 
     # Filter for property/listing/apartment related classes
-    relevant_classes = [c for c in all_classes if any(keyword in c.lower()
-                       for keyword in ['property', 'listing', 'apartment', 'placard', 'card', 'item'])]
+    relevant_classes = _relevant_classes(html)
 
     for i, class_name in enumerate(sorted(relevant_classes)[:20]):
-        print(f"  {class_name}")
+        _p(f"  {class_name}")
         if i >= 19:
-            print(f"  ... and {len(relevant_classes) - 20} more")
+            _p(f"  ... and {len(relevant_classes) - 20} more")
             break
 
-    print()
+    _p()
 
     # Check for JavaScript/React apps
-    print("Checking for JavaScript rendering:")
-    print("-" * 80)
+    _p("Checking for JavaScript rendering:")
+    _p("-" * 80)
     if 'react' in html.lower() or '__next' in html.lower() or 'vue' in html.lower():
-        print("⚠️  Page appears to use JavaScript framework (React/Next.js/Vue)")
-        print("    May require Selenium for dynamic content")
+        _p("⚠️  Page appears to use JavaScript framework (React/Next.js/Vue)")
+        _p("    May require Selenium for dynamic content")
     else:
-        print("✓ Page appears to be server-side rendered")
+        _p("✓ Page appears to be server-side rendered")
 
-    print()
+    _p()
 
 
+@_buffered
 def main():
     """Run all debug tests."""
-    print("\n" + "=" * 80)
-    print("APARTMENTS.COM SCRAPER DEBUG")
-    print("=" * 80)
-    print()
+    _p("\n" + "=" * 80)
+    _p("APARTMENTS.COM SCRAPER DEBUG")
+    _p("=" * 80)
+    _p()
 
     # Step 1: Test URL building
     url = test_url_building()
 
-    # Step 2: Fetch the page
-    html = fetch_and_analyze(url)
+    # Step 2: Fetch the first page and pagination probes
+    html = fetch_and_analyze(build_probe_urls(url))
 
     if not html:
-        print("❌ Could not fetch page. Exiting.")
+        _p("❌ Could not fetch page. Exiting.")
         return
 
     # Step 3: Analyze HTML structure
     analyze_html_structure(html)
 
-    print("=" * 80)
-    print("DEBUG COMPLETE")
-    print("=" * 80)
-    print()
-    print("Next steps:")
-    print("1. Check debug_page_sample.html to inspect the actual HTML")
-    print("2. Look for the correct CSS selectors for listings")
-    print("3. Update scraper.py with the correct selectors")
-    print()
+    _p("=" * 80)
+    _p("DEBUG COMPLETE")
+    _p("=" * 80)
+    _p()
+    _p("Next steps:")
+    _p("1. Check debug_page_sample.html to inspect the actual HTML")
+    _p("2. Look for the correct CSS selectors for listings")
+    _p("3. Update scraper.py with the correct selectors")
+    _p()
 
 
 if __name__ == '__main__':
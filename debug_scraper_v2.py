@@ -7,10 +7,121 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
-import time
-import re
+from selenium.common.exceptions import TimeoutException
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from cssselect import HTMLTranslator
+from concurrent.futures import ThreadPoolExecutor
+import os
+import queue
+import shutil
+import tempfile
 from src.config import Config
+from src.slug import slugify
+
+
+# Number of result pages probed, each loaded in its own pooled browser
+PROBE_PAGES = 3
+MAX_DRIVERS = (os.cpu_count() or 1) * 2
+
+# Listing containers to wait for instead of sleeping a fixed time
+LISTING_READY_SELECTOR = 'article,[class*="placard"]'
+PAGE_LOAD_TIMEOUT = 10
+
+# Structural probing never needs images, fonts, or CSS. Each pooled browser
+# gets its own fresh profile directory (Chrome locks a profile to one
+# process), removed again when the run ends.
+PROFILE_PREFIX = 'scraper_profile_'
+CONTENT_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'permissions.default.stylesheet': 2,
+}
+BLOCKED_URL_PATTERNS = ['*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.svg', '*.woff', '*.woff2', '*.css']
+
+# Selector battery, compiled to XPath once at import
+SELECTORS = (
+    ('article.placard', 'Original selector from code'),
+    ('li.mortar-wrapper', 'Alternative from code'),
+    ('[data-listingid]', 'Data attribute'),
+    ('article', 'All articles'),
+    ('.property', 'Property class'),
+    ('.propertyCard', 'Property card'),
+    ('[class*="property"]', 'Any property class'),
+)
+_COMPILED_SELECTORS = [
+    (selector, description, CSSSelector(selector, translator='html'))
+    for selector, description in SELECTORS
+]
+
+# Counts every selector in the live DOM in a single WebDriver round trip
+_COUNT_SELECTORS_JS = 'return arguments[0].map(s => document.querySelectorAll(s).length);'
+
+# Sample field lookups search below the listing only, like BeautifulSoup's select_one
+_translator = HTMLTranslator()
+_PRICE_XPATH = etree.XPath(_translator.css_to_xpath('[class*="price"], [class*="rent"]', prefix='descendant::'))
+_BEDS_XPATH = etree.XPath(_translator.css_to_xpath('[class*="bed"]', prefix='descendant::'))
+
+
+def _text(elem):
+    """Return the element's stripped text, matching BeautifulSoup's get_text(strip=True)."""
+    return ''.join(s.strip() for s in elem.itertext())
+
+
+def _create_driver(profile_dir):
+    """Create a headless Chrome driver that skips images, fonts, and CSS."""
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')  # Run in background
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+    chrome_options.add_experimental_option('prefs', CONTENT_PREFS)
+
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    return driver
+
+
+def _load_page(drivers, url):
+    """
+    Load a URL on a pooled driver.
+
+    Returns:
+        (html, counts, error) - the rendered HTML and per-selector match
+        counts in SELECTORS order, taken from the browser's own DOM; or
+        (None, None, error) if the page couldn't be loaded
+    """
+    driver = drivers.get()
+    try:
+        driver.get(url)
+        try:
+            WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, LISTING_READY_SELECTOR))
+            )
+        except TimeoutException:
+            pass  # Analyze whatever rendered; the selector report shows what's missing
+        counts = driver.execute_script(_COUNT_SELECTORS_JS, [s for s, _ in SELECTORS])
+        return driver.page_source, counts, None
+    except Exception as e:
+        # Report per page instead of ending the whole run
+        return None, None, e
+    finally:
+        drivers.put(driver)
+
+
+def _quit_drivers(drivers, profile_dirs):
+    """Drain the driver pool, quit every browser, and remove their profiles."""
+    while True:
+        try:
+            drivers.get_nowait().quit()
+        except queue.Empty:
+            break
+
+    for profile_dir in profile_dirs:
+        shutil.rmtree(profile_dir, ignore_errors=True)
 
 
 def test_with_selenium():
@@ -25,81 +136,82 @@ def test_with_selenium():
     location = config.location
 
     # Build URL
-    location_slug = location.lower()
-    location_slug = re.sub(r'[^\w\s-]', '', location_slug)
-    location_slug = re.sub(r'[\s_]+', '-', location_slug)
+    location_slug = slugify(location)
     url = f"https://www.apartments.com/{location_slug}/"
+    urls = [url] + [f"{url}{page}/" for page in range(2, PROBE_PAGES + 1)]
 
     print(f"Location: {location}")
     print(f"URL: {url}")
     print()
 
-    # Setup Selenium with Chrome
+    # Setup a pool of pre-warmed Chrome drivers, one per concurrent page load
     print("Setting up Selenium...")
-    chrome_options = Options()
-    chrome_options.add_argument('--headless')  # Run in background
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    pool_size = min(len(urls), MAX_DRIVERS)
+    drivers = queue.Queue()
+    profile_dirs = [tempfile.mkdtemp(prefix=PROFILE_PREFIX) for _ in range(pool_size)]
 
-    try:
-        driver = webdriver.Chrome(options=chrome_options)
-        print("✓ Chrome driver initialized")
-    except Exception as e:
-        print(f"❌ Error initializing Chrome driver: {e}")
+    with ThreadPoolExecutor(max_workers=pool_size) as executor:
+        futures = [executor.submit(_create_driver, profile_dir) for profile_dir in profile_dirs]
+
+    init_error = None
+    for future in futures:
+        try:
+            drivers.put(future.result())
+        except Exception as e:
+            init_error = e
+
+    if init_error is None:
+        print(f"✓ Chrome driver pool initialized ({pool_size} drivers)")
+    else:
+        print(f"❌ Error initializing Chrome driver: {init_error}")
         print("\nYou may need to install ChromeDriver:")
         print("  brew install chromedriver")
         print("  or download from: https://chromedriver.chromium.org/")
+        _quit_drivers(drivers, profile_dirs)
         return
 
     try:
-        # Load the page
-        print(f"\nFetching: {url}")
-        driver.get(url)
-
-        # Wait for content to load
-        print("Waiting for page to load...")
-        time.sleep(5)  # Give JavaScript time to render
+        # Load all pages concurrently, waiting for listings rather than a fixed delay
+        print(f"\nFetching {len(urls)} pages...")
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            pages = list(executor.map(lambda u: _load_page(drivers, u), urls))
 
-        # Get page source
-        html = driver.page_source
-        print(f"✓ Page loaded ({len(html)} characters)")
+        for page_url, (page_html, _, error) in zip(urls, pages):
+            if error is None:
+                print(f"✓ {page_url} loaded ({len(page_html)} characters)")
+            else:
+                print(f"❌ Error loading {page_url}: {error}")
         print()
 
+        html, counts, error = pages[0]
+        if error is not None:
+            print("❌ The search page didn't load, so there is nothing to analyze")
+            return
+
         # Save the HTML
         with open('debug_selenium_page.html', 'w', encoding='utf-8') as f:
             f.write(html)
         print("✓ Saved full HTML to: debug_selenium_page.html")
         print()
 
-        # Analyze with BeautifulSoup
-        soup = BeautifulSoup(html, 'lxml')
+        # Analyze with lxml
+        tree = lxml.html.document_fromstring(html)
 
         # Get page title
-        title = soup.find('title')
-        print(f"Page Title: {title.get_text() if title else 'None'}")
+        title = tree.find('.//title')
+        print(f"Page Title: {title.text_content() if title is not None else 'None'}")
         print()
 
         # Test various selectors
         print("Testing CSS selectors:")
         print("-" * 80)
 
-        selectors = [
-            ('article.placard', 'Original selector from code'),
-            ('li.mortar-wrapper', 'Alternative from code'),
-            ('[data-listingid]', 'Data attribute'),
-            ('article', 'All articles'),
-            ('.property', 'Property class'),
-            ('.propertyCard', 'Property card'),
-            ('[class*="property"]', 'Any property class'),
-        ]
-
         best_selector = None
         best_count = 0
 
-        for selector, description in selectors:
-            elements = soup.select(selector)
-            count = len(elements)
+        # Counts come from the browser; the parsed tree is only queried for
+        # samples of the selectors that improve on the best match so far
+        for (selector, description, compiled), count in zip(_COMPILED_SELECTORS, counts):
             print(f"  {selector:<30} → {count:>3} elements ({description})")
 
             if count > best_count and count < 100:  # Reasonable number
@@ -107,19 +219,20 @@ def test_with_selenium():
                 best_count = count
 
                 # Show sample
-                if count > 0:
+                elements = compiled(tree)
+                if elements:
                     sample = elements[0]
-                    print(f"    Sample classes: {sample.get('class', [])}")
+                    print(f"    Sample classes: {sample.get('class', '').split()}")
                     print(f"    Sample IDs: {sample.get('id', 'none')}")
 
                     # Try to find key info
-                    price = sample.select_one('[class*="price"], [class*="rent"]')
-                    beds = sample.select_one('[class*="bed"]')
+                    price = next(iter(_PRICE_XPATH(sample)), None)
+                    beds = next(iter(_BEDS_XPATH(sample)), None)
 
-                    if price:
-                        print(f"    Price found: {price.get_text(strip=True)[:50]}")
-                    if beds:
-                        print(f"    Beds found: {beds.get_text(strip=True)[:50]}")
+                    if price is not None:
+                        print(f"    Price found: {_text(price)[:50]}")
+                    if beds is not None:
+                        print(f"    Beds found: {_text(beds)[:50]}")
 
                     print()
 
@@ -148,8 +261,8 @@ def test_with_selenium():
         print()
 
     finally:
-        driver.quit()
-        print("✓ Browser closed")
+        _quit_drivers(drivers, profile_dirs)
+        print("✓ Browsers closed")
 
 
 if __name__ == '__main__':
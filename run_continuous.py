@@ -3,10 +3,16 @@ Continuous monitoring script for the Housing Notification System.
 Runs the system in a loop with configurable intervals.
 """
 
+import asyncio
+import functools
+import json
+import signal
+import threading
 import time
 import argparse
 import logging
 from datetime import datetime
+from typing import Optional, Tuple
 from src.main import HousingNotificationSystem
 
 
@@ -16,52 +22,200 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Seconds a health check client gets to send its request
+HEALTH_READ_TIMEOUT = 5
 
-def run_continuous(interval_minutes: int = 30, max_pages: int = 3, config_path: str = "config.json"):
+# Seconds an aborted run gets to close its browsers before the process exits
+ABORT_JOIN_TIMEOUT = 15
+
+
+async def _read_request_line(reader: asyncio.StreamReader) -> bytes:
+    """Read the request line and drain the headers that follow it."""
+    request_line = await reader.readline()
+    while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+        pass
+    return request_line
+
+
+async def _handle_health(state: dict, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Answer GET /healthz with the current run count; 404 for anything else."""
+    try:
+        request_line = await asyncio.wait_for(_read_request_line(reader), HEALTH_READ_TIMEOUT)
+
+        parts = request_line.split()
+        if len(parts) >= 2 and parts[1] == b'/healthz':
+            status = '200 OK'
+            body = json.dumps({'status': 'ok', 'run_count': state['run_count']}).encode()
+        else:
+            status = '404 Not Found'
+            body = b'{"status": "not found"}'
+
+        writer.write(
+            f"HTTP/1.1 {status}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+    except (asyncio.TimeoutError, ConnectionError):
+        # Idle or disconnected client; just drop the connection
+        pass
+    finally:
+        writer.close()
+
+
+def _settle(future: asyncio.Future, result, exc: Optional[BaseException]):
+    """Resolve future from a worker's outcome, unless it was cancelled meanwhile."""
+    if future.done():
+        return
+    if exc is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(result)
+
+
+def _start_daemon_thread(func, *args, **kwargs) -> Tuple[threading.Thread, asyncio.Future]:
     """
-    Run the housing notification system continuously.
+    Like asyncio.to_thread, but on a daemon thread, returned with the future.
 
-    Args:
-        interval_minutes: Minutes to wait between checks
-        max_pages: Maximum pages to scrape per run
-        config_path: Path to configuration file
+    Neither asyncio.run nor the interpreter waits for a daemon thread on
+    the way out, so a second Ctrl+C can abort a run in progress instead of
+    waiting for it to finish; see run_continuous.
     """
-    logger.info("=" * 80)
-    logger.info("Starting Housing Notification System in CONTINUOUS mode")
-    logger.info(f"Check interval: {interval_minutes} minutes")
-    logger.info(f"Press Ctrl+C to stop")
-    logger.info("=" * 80)
-    print()
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
 
-    system = HousingNotificationSystem(config_path=config_path)
-    run_count = 0
+    def target():
+        try:
+            outcome = (func(*args, **kwargs), None)
+        except BaseException as e:
+            outcome = (None, e)
+        try:
+            loop.call_soon_threadsafe(_settle, future, *outcome)
+        except RuntimeError:
+            pass  # The loop already shut down after an abort
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    return thread, future
+
+
+async def _run_loop(system: HousingNotificationSystem, state: dict, interval_minutes: int,
+                    max_pages: int, health_port: Optional[int]):
+    """
+    Run the system on a fixed interval inside one event loop.
+
+    Each run executes in a worker thread so the loop stays free to answer
+    health checks and react to SIGINT/SIGTERM during the wait. A signal
+    during a run stops the loop once the run finishes; a further Ctrl+C
+    aborts the run.
+    """
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    in_run = False
+
+    def request_stop():
+        if stop_event.is_set():
+            return
+        stop_event.set()
+        if in_run:
+            logger.info("Stopping after the current run finishes (press Ctrl+C again to abort it)")
+        # Hand SIGINT back to Python, so the next Ctrl+C raises KeyboardInterrupt
+        loop.remove_signal_handler(signal.SIGINT)
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, request_stop)
+        except NotImplementedError:
+            # Signal handlers aren't supported on Windows; Ctrl+C still
+            # raises KeyboardInterrupt there
+            pass
+
+    server = None
+    if health_port is not None:
+        server = await asyncio.start_server(
+            functools.partial(_handle_health, state), '127.0.0.1', health_port
+        )
+        logger.info(f"Health check available at: http://127.0.0.1:{health_port}/healthz")
 
     try:
-        while True:
-            run_count += 1
+        while not stop_event.is_set():
+            run_count = state['run_count'] + 1
             logger.info(f"\n{'=' * 80}")
             logger.info(f"Run #{run_count} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             logger.info(f"{'=' * 80}\n")
 
+            in_run = True
             try:
-                system.run(max_pages=max_pages, dry_run=False)
+                state['worker'], result = _start_daemon_thread(
+                    system.run, max_pages=max_pages, dry_run=False
+                )
+                await result
             except Exception as e:
                 logger.error(f"Error during run #{run_count}: {e}", exc_info=True)
                 logger.info("Continuing to next scheduled run...")
+            finally:
+                in_run = False
+
+            # Counted once finished, so an aborted run isn't included
+            state['run_count'] = run_count
 
-            # Wait for the specified interval
+            if stop_event.is_set():
+                break
+
+            # Wait for the specified interval, waking early on shutdown
             logger.info(f"\n{'=' * 80}")
             logger.info(f"Waiting {interval_minutes} minutes until next check...")
             logger.info(f"Next run at: {datetime.fromtimestamp(time.time() + interval_minutes * 60).strftime('%Y-%m-%d %H:%M:%S')}")
             logger.info(f"{'=' * 80}\n")
 
-            time.sleep(interval_minutes * 60)
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=interval_minutes * 60)
+            except asyncio.TimeoutError:
+                pass
+
+    finally:
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
 
+def run_continuous(interval_minutes: int = 30, max_pages: int = 3, config_path: str = "config.json",
+                   health_port: Optional[int] = None):
+    """
+    Run the housing notification system continuously.
+
+    Args:
+        interval_minutes: Minutes to wait between checks
+        max_pages: Maximum pages to scrape per run
+        config_path: Path to configuration file
+        health_port: Optional localhost port for a /healthz endpoint
+    """
+    logger.info("=" * 80)
+    logger.info("Starting Housing Notification System in CONTINUOUS mode")
+    logger.info(f"Check interval: {interval_minutes} minutes")
+    logger.info(f"Press Ctrl+C to stop")
+    logger.info("=" * 80)
+    print()
+
+    system = HousingNotificationSystem(config_path=config_path)
+    state = {'run_count': 0, 'worker': None}
+
+    try:
+        asyncio.run(_run_loop(system, state, interval_minutes, max_pages, health_port))
     except KeyboardInterrupt:
-        logger.info("\n\n" + "=" * 80)
-        logger.info("Stopping continuous monitoring (Ctrl+C detected)")
-        logger.info(f"Total runs completed: {run_count}")
-        logger.info("=" * 80)
+        # A run interrupted part way: quit its browsers so it unwinds through
+        # the scraper's cleanup, and give it a moment to finish doing so
+        worker = state['worker']
+        if worker is not None and worker.is_alive():
+            logger.info("Aborting the current run...")
+            system.scraper.abort()
+            worker.join(ABORT_JOIN_TIMEOUT)
+
+    logger.info("\n\n" + "=" * 80)
+    logger.info("Stopping continuous monitoring")
+    logger.info(f"Total runs completed: {state['run_count']}")
+    logger.info("=" * 80)
 
 
 def main():
@@ -90,6 +244,13 @@ def main():
         help='Path to configuration file (default: config.json)'
     )
 
+    parser.add_argument(
+        '--health-port',
+        type=int,
+        default=None,
+        help='Serve a /healthz endpoint on this localhost port (default: disabled)'
+    )
+
     args = parser.parse_args()
 
     # Validate interval
@@ -115,7 +276,8 @@ def main():
     run_continuous(
         interval_minutes=args.interval,
         max_pages=args.pages,
-        config_path=args.config
+        config_path=args.config,
+        health_port=args.health_port
     )
 
 
@@ -4,8 +4,76 @@ Loads settings from config.json and provides easy access to configuration values
 """
 
 import json
-import os
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib parser
+    orjson = None
+
+# Cached marker for key paths that don't resolve, distinct from a stored None
+_MISSING = object()
+
+# Dotted key paths split once into key tuples, shared by every Config
+_PATH_CACHE: Dict[str, Tuple[str, ...]] = {}
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Immutable view of the settings exposed as Config properties."""
+
+    __slots__ = (
+        'location',
+        'neighborhoods',
+        'min_price',
+        'max_price',
+        'min_bedrooms',
+        'max_bedrooms',
+        'min_bathrooms',
+        'max_bathrooms',
+        'min_square_feet',
+        'max_square_feet',
+        'check_interval_minutes',
+        'max_retries',
+        'timeout_seconds',
+        'user_agent',
+        'headless',
+        'parallel_neighborhoods',
+        'max_parallel_browsers',
+        'detail_page_delay_min',
+        'detail_page_delay_max',
+        'notifications_enabled',
+        'notification_type',
+        'max_listings_per_notification',
+        'db_path',
+        'retention_days',
+    )
+
+    location: str
+    neighborhoods: list
+    min_price: Optional[float]
+    max_price: Optional[float]
+    min_bedrooms: Optional[int]
+    max_bedrooms: Optional[int]
+    min_bathrooms: Optional[float]
+    max_bathrooms: Optional[float]
+    min_square_feet: Optional[int]
+    max_square_feet: Optional[int]
+    check_interval_minutes: int
+    max_retries: int
+    timeout_seconds: int
+    user_agent: str
+    headless: bool
+    parallel_neighborhoods: bool
+    max_parallel_browsers: int
+    detail_page_delay_min: int
+    detail_page_delay_max: int
+    notifications_enabled: bool
+    notification_type: str
+    max_listings_per_notification: int
+    db_path: str
+    retention_days: int
 
 
 class Config:
@@ -20,24 +88,30 @@ class Config:
         """
         self.config_path = config_path
         self.config_data = self._load_config()
+        self._cache: Dict[str, Any] = {}
+        self._snapshot = self._build_snapshot()
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from JSON file."""
-        if not os.path.exists(self.config_path):
+        try:
+            with open(self.config_path, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Configuration file not found: {self.config_path}\n"
                 "Please create a config.json file based on the template."
-            )
+            ) from None
 
         try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+            return orjson.loads(raw) if orjson else json.loads(raw)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in config file: {e}")
 
     def reload(self):
         """Reload configuration from file."""
         self.config_data = self._load_config()
+        self._cache.clear()
+        self._snapshot = self._build_snapshot()
 
     def get(self, key_path: str, default: Any = None) -> Any:
         """
@@ -54,138 +128,180 @@ class Config:
         Returns:
             Configuration value or default.
         """
-        keys = key_path.split('.')
-        value = self.config_data
+        try:
+            value = self._cache[key_path]
+        except KeyError:
+            value = self._cache[key_path] = self._resolve(key_path)
 
+        return default if value is _MISSING else value
+
+    def _resolve(self, key_path: str) -> Any:
+        """Walk config_data along a dotted path, returning _MISSING if absent."""
+        keys = _PATH_CACHE.get(key_path)
+        if keys is None:
+            keys = _PATH_CACHE[key_path] = tuple(key_path.split('.'))
+
+        value = self.config_data
         for key in keys:
             if isinstance(value, dict) and key in value:
                 value = value[key]
             else:
-                return default
+                return _MISSING
 
         return value
 
+    def _build_snapshot(self) -> ConfigSnapshot:
+        """Resolve every property's key path (and default) once."""
+        return ConfigSnapshot(
+            location=self.get('search_criteria.location', ''),
+            neighborhoods=self.get('search_criteria.neighborhoods', []),
+            min_price=self.get('search_criteria.price_range.min'),
+            max_price=self.get('search_criteria.price_range.max'),
+            min_bedrooms=self.get('search_criteria.bedrooms.min'),
+            max_bedrooms=self.get('search_criteria.bedrooms.max'),
+            min_bathrooms=self.get('search_criteria.bathrooms.min'),
+            max_bathrooms=self.get('search_criteria.bathrooms.max'),
+            min_square_feet=self.get('search_criteria.square_feet.min'),
+            max_square_feet=self.get('search_criteria.square_feet.max'),
+            check_interval_minutes=self.get('scraper_settings.check_interval_minutes', 30),
+            max_retries=self.get('scraper_settings.max_retries', 3),
+            timeout_seconds=self.get('scraper_settings.timeout_seconds', 30),
+            user_agent=self.get('scraper_settings.user_agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'),
+            headless=self.get('scraper_settings.headless', True),
+            parallel_neighborhoods=self.get('scraper_settings.parallel_neighborhoods', True),
+            max_parallel_browsers=self.get('scraper_settings.max_parallel_browsers', 4),
+            detail_page_delay_min=self.get('scraper_settings.detail_page_delay_min', 5),
+            detail_page_delay_max=self.get('scraper_settings.detail_page_delay_max', 10),
+            notifications_enabled=self.get('notification_settings.enabled', True),
+            notification_type=self.get('notification_settings.notification_type', 'console'),
+            max_listings_per_notification=self.get('notification_settings.max_listings_per_notification', 10),
+            db_path=self.get('database_settings.db_path', 'data/listings.db'),
+            retention_days=self.get('database_settings.retention_days', 30),
+        )
+
     # Search Criteria Properties
     @property
     def location(self) -> str:
         """Get search location."""
-        return self.get('search_criteria.location', '')
+        return self._snapshot.location
 
     @property
     def neighborhoods(self) -> list:
         """Get list of neighborhoods to search within."""
-        return self.get('search_criteria.neighborhoods', [])
+        return self._snapshot.neighborhoods
 
     @property
     def min_price(self) -> Optional[float]:
         """Get minimum price."""
-        return self.get('search_criteria.price_range.min')
+        return self._snapshot.min_price
 
     @property
     def max_price(self) -> Optional[float]:
         """Get maximum price."""
-        return self.get('search_criteria.price_range.max')
+        return self._snapshot.max_price
 
     @property
     def min_bedrooms(self) -> Optional[int]:
         """Get minimum bedrooms."""
-        return self.get('search_criteria.bedrooms.min')
+        return self._snapshot.min_bedrooms
 
     @property
     def max_bedrooms(self) -> Optional[int]:
         """Get maximum bedrooms."""
-        return self.get('search_criteria.bedrooms.max')
+        return self._snapshot.max_bedrooms
 
     @property
     def min_bathrooms(self) -> Optional[float]:
         """Get minimum bathrooms."""
-        return self.get('search_criteria.bathrooms.min')
+        return self._snapshot.min_bathrooms
 
     @property
     def max_bathrooms(self) -> Optional[float]:
         """Get maximum bathrooms."""
-        return self.get('search_criteria.bathrooms.max')
+        return self._snapshot.max_bathrooms
 
     @property
     def min_square_feet(self) -> Optional[int]:
         """Get minimum square feet."""
-        return self.get('search_criteria.square_feet.min')
+        return self._snapshot.min_square_feet
 
     @property
     def max_square_feet(self) -> Optional[int]:
         """Get maximum square feet."""
-        return self.get('search_criteria.square_feet.max')
+        return self._snapshot.max_square_feet
 
     # Scraper Settings Properties
     @property
     def check_interval_minutes(self) -> int:
         """Get check interval in minutes."""
-        return self.get('scraper_settings.check_interval_minutes', 30)
+        return self._snapshot.check_interval_minutes
 
     @property
     def max_retries(self) -> int:
         """Get maximum number of retries."""
-        return self.get('scraper_settings.max_retries', 3)
+        return self._snapshot.max_retries
 
     @property
     def timeout_seconds(self) -> int:
         """Get request timeout in seconds."""
-        return self.get('scraper_settings.timeout_seconds', 30)
+        return self._snapshot.timeout_seconds
 
     @property
     def user_agent(self) -> str:
         """Get user agent string."""
-        return self.get(
-            'scraper_settings.user_agent',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        )
+        return self._snapshot.user_agent
 
     @property
     def headless(self) -> bool:
         """Get headless browser mode setting."""
-        return self.get('scraper_settings.headless', True)
+        return self._snapshot.headless
 
     @property
     def parallel_neighborhoods(self) -> bool:
         """Get parallel neighborhood scraping setting."""
-        return self.get('scraper_settings.parallel_neighborhoods', True)
+        return self._snapshot.parallel_neighborhoods
+
+    @property
+    def max_parallel_browsers(self) -> int:
+        """Get maximum number of browsers used for parallel neighborhood scraping."""
+        return self._snapshot.max_parallel_browsers
 
     @property
     def detail_page_delay_min(self) -> int:
         """Get minimum delay between detail page requests (seconds)."""
-        return self.get('scraper_settings.detail_page_delay_min', 5)
+        return self._snapshot.detail_page_delay_min
 
     @property
     def detail_page_delay_max(self) -> int:
         """Get maximum delay between detail page requests (seconds)."""
-        return self.get('scraper_settings.detail_page_delay_max', 10)
+        return self._snapshot.detail_page_delay_max
 
     # Notification Settings Properties
     @property
     def notifications_enabled(self) -> bool:
         """Check if notifications are enabled."""
-        return self.get('notification_settings.enabled', True)
+        return self._snapshot.notifications_enabled
 
     @property
     def notification_type(self) -> str:
         """Get notification type (console, sms, etc.)."""
-        return self.get('notification_settings.notification_type', 'console')
+        return self._snapshot.notification_type
 
     @property
     def max_listings_per_notification(self) -> int:
         """Get maximum listings per notification."""
-        return self.get('notification_settings.max_listings_per_notification', 10)
+        return self._snapshot.max_listings_per_notification
 
     # Database Settings Properties
     @property
     def db_path(self) -> str:
         """Get database file path."""
-        return self.get('database_settings.db_path', 'data/listings.db')
+        return self._snapshot.db_path
 
     @property
     def retention_days(self) -> int:
         """Get data retention period in days."""
-        return self.get('database_settings.retention_days', 30)
+        return self._snapshot.retention_days
 
     def validate(self) -> bool:
         """
@@ -218,6 +334,9 @@ class Config:
             if self.min_bathrooms > self.max_bathrooms:
                 errors.append("min_bathrooms cannot be greater than max_bathrooms")
 
+        if self.max_parallel_browsers < 1:
+            errors.append("max_parallel_browsers must be at least 1")
+
         if errors:
             raise ValueError("Configuration validation failed:\n" + "\n".join(errors))
 
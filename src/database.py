@@ -6,11 +6,119 @@ Uses SQLite for lightweight, local storage.
 import sqlite3
 import os
 import logging
+import queue
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Prepared statements kept per connection (sqlite3's default is 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Idle connections kept open for reuse; more are opened while all are busy
+POOL_SIZE = 4
+
+# IDs bound per "IN (...)" lookup; SQLite before 3.32 allows 999 parameters
+MAX_IN_PARAMS = 500
+
+# Applied to every connection. WAL with synchronous=NORMAL only syncs at
+# checkpoints instead of on every commit, and stays consistent after a crash.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",  # ~20 MB
+)
+
+_INSERT_LISTING_SQL = """
+    INSERT INTO listings (
+        listing_id, url, title, address, neighborhood, price,
+        bedrooms, bathrooms, square_feet, availability_date, pets_allowed
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(listing_id) DO NOTHING
+"""
+
+# Listing columns plus age_s, the whole seconds since the listing was first
+# seen, and neighborhood_group, the heading the listing is grouped under.
+# first_seen is stored in UTC, as is SQLite's 'now'.
+_LISTING_COLUMNS = (
+    "*, strftime('%s', 'now') - strftime('%s', first_seen) AS age_s, "
+    "COALESCE(NULLIF(neighborhood, ''), 'Unknown') AS neighborhood_group"
+)
+
+# ORDER BY clauses for the listing sort orders. Listings stored in the same
+# second are ordered by insertion; idx_first_seen covers both columns.
+LISTING_ORDERS = {
+    'newest': 'first_seen DESC, id DESC',
+    'oldest': 'first_seen ASC, id ASC',
+    # Listings without a price sort as 0; equal prices stay newest first
+    'price_high': 'COALESCE(price, 0) DESC, first_seen DESC, id DESC',
+    'price_low': 'COALESCE(price, 0) ASC, first_seen DESC, id DESC',
+}
+
+# Row-value comparison selecting the listings after a page cursor, per order
+_KEYSET_CONDITIONS = {
+    'newest': '(first_seen, id) < (?, ?)',
+    'oldest': '(first_seen, id) > (?, ?)',
+}
+
+
+def page_cursor(listing) -> Tuple[str, int]:
+    """Return the keyset cursor for paging past a listing row."""
+    return listing.first_seen, listing.id
+
+
+# Leading ORDER BY terms that keep each neighborhood's listings together,
+# sections in name order with listings without a neighborhood last
+_NEIGHBORHOOD_ORDER = (
+    "COALESCE(NULLIF(neighborhood, ''), 'Unknown') = 'Unknown', "
+    "COALESCE(NULLIF(neighborhood, ''), 'Unknown')"
+)
+
+
+def _order_by(order: str, by_neighborhood: bool) -> str:
+    """Build the ORDER BY clause for a listing query."""
+    if by_neighborhood:
+        return f"ORDER BY {_NEIGHBORHOOD_ORDER}, {LISTING_ORDERS[order]}"
+    return f"ORDER BY {LISTING_ORDERS[order]}"
+
+
+# Columns added after the original schema, with their ALTER TABLE definitions
+_MIGRATED_COLUMNS = (
+    ('favorited', 'BOOLEAN DEFAULT FALSE'),
+    ('neighborhood', 'TEXT'),
+    ('pets_allowed', 'BOOLEAN'),
+)
+
+
+def _listing_params(listing: Dict) -> tuple:
+    """Build the _INSERT_LISTING_SQL parameters for a listing dict."""
+    return (
+        listing['listing_id'],
+        listing['url'],
+        listing.get('title'),
+        listing.get('address'),
+        listing.get('neighborhood'),
+        listing.get('price'),
+        listing.get('bedrooms'),
+        listing.get('bathrooms'),
+        listing.get('square_feet'),
+        listing.get('availability_date'),
+        listing.get('pets_allowed')
+    )
+
+
+@lru_cache(maxsize=None)
+def _row_type(fields: Tuple[str, ...]):
+    """Return the namedtuple class for rows with the given column names."""
+    return namedtuple('ListingRow', fields)
+
 
 class ListingDatabase:
     """Manages SQLite database operations for housing listings."""
@@ -19,14 +127,90 @@ class ListingDatabase:
         """Initialize database connection and create tables if needed."""
         self.db_path = db_path
 
-        # Ensure data directory exists
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        # Ensure data directory exists (a bare filename lives in the cwd)
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.isdir(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
+
+        # SQLite runs one write at a time, so writes share a single connection
+        # behind a lock instead of waiting on each other's locks in the file
+        self._write_conn = self._connect(read_only=False)
+        self._write_lock = threading.Lock()
+
+        # Read connections are pooled rather than shared, so web UI request
+        # threads read concurrently (WAL allows it) instead of queueing on one
+        # connection, and never wait on the writer. Queries only bind
+        # parameters, so each connection's statement cache covers them all.
+        self._pool: queue.LifoQueue = queue.LifoQueue(maxsize=POOL_SIZE)
+        self._closed = False
+
+        # Never writes, so its data_version moves on every commit; see data_version
+        self._version_conn = self._connect()
+        self._version_lock = threading.Lock()
+
+        # Guards _known_ids
+        self._lock = threading.Lock()
+
+        # listing_ids known to be stored, loaded on first use by existing_ids,
+        # and the data_version they were read at
+        self._known_ids: Optional[Set[str]] = None
+        self._known_version: Optional[int] = None
 
         self._create_tables()
 
+    def _connect(self, read_only: bool = True) -> sqlite3.Connection:
+        """Open a connection configured for this database."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        if read_only:
+            # Fail any write sent to a reader instead of taking the write lock
+            conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    @contextmanager
+    def _writer(self) -> Iterator[sqlite3.Connection]:
+        """Hold the write connection."""
+        with self._write_lock:
+            yield self._write_conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Check a read connection out of the pool, opening one if none are idle."""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+
+        try:
+            yield conn
+        finally:
+            if self._closed:
+                conn.close()
+            else:
+                try:
+                    self._pool.put_nowait(conn)
+                except queue.Full:
+                    conn.close()
+
+    def close(self):
+        """Close the database connections."""
+        self._closed = True
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._version_lock:
+            self._version_conn.close()
+        with self._write_lock:
+            self._write_conn.close()
+
     def _create_tables(self):
         """Create database tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._writer() as conn, conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -62,62 +246,103 @@ class ListingDatabase:
                 ON listings(first_seen)
             """)
 
-            conn.commit()
-
-        # Add columns if they don't exist (for existing databases)
-        self._add_favorited_column_if_needed()
-        self._add_neighborhood_column_if_needed()
-        self._add_pets_allowed_column_if_needed()
-
-    def _add_favorited_column_if_needed(self):
-        """Add favorited column to existing databases."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            # Check if column exists
-            cursor.execute("PRAGMA table_info(listings)")
-            columns = [col[1] for col in cursor.fetchall()]
-
-            if 'favorited' not in columns:
-                logger.info("Adding 'favorited' column to existing database")
-                cursor.execute("ALTER TABLE listings ADD COLUMN favorited BOOLEAN DEFAULT FALSE")
-                conn.commit()
-
-    def _add_neighborhood_column_if_needed(self):
-        """Add neighborhood column to existing databases."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            # Check if column exists
-            cursor.execute("PRAGMA table_info(listings)")
-            columns = [col[1] for col in cursor.fetchall()]
-
-            if 'neighborhood' not in columns:
-                logger.info("Adding 'neighborhood' column to existing database")
-                cursor.execute("ALTER TABLE listings ADD COLUMN neighborhood TEXT")
-                conn.commit()
-
-    def _add_pets_allowed_column_if_needed(self):
-        """Add pets_allowed column to existing databases."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            # Check if column exists
-            cursor.execute("PRAGMA table_info(listings)")
-            columns = [col[1] for col in cursor.fetchall()]
-
-            if 'pets_allowed' not in columns:
-                logger.info("Adding 'pets_allowed' column to existing database")
-                cursor.execute("ALTER TABLE listings ADD COLUMN pets_allowed BOOLEAN")
-                conn.commit()
+            # Add columns if they don't exist (for existing databases)
+            self._migrate_schema(cursor)
+
+            # Indexes on migrated columns are created once those columns exist
+            self._create_query_indexes(cursor)
+
+    def _migrate_schema(self, cursor: sqlite3.Cursor):
+        """Add columns introduced after a database was first created."""
+        cursor.execute("PRAGMA table_info(listings)")
+        columns = {col[1] for col in cursor.fetchall()}
+
+        for name, definition in _MIGRATED_COLUMNS:
+            if name not in columns:
+                logger.info(f"Adding '{name}' column to existing database")
+                cursor.execute(f"ALTER TABLE listings ADD COLUMN {name} {definition}")
+
+    def _create_query_indexes(self, cursor: sqlite3.Cursor):
+        """Create indexes matching the unnotified, favorited and price-sorted listing queries."""
+        # get_unnotified_listings: WHERE notified = FALSE ORDER BY first_seen DESC
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_notified_first_seen
+            ON listings(notified, first_seen DESC)
+        """)
+
+        # get_favorited_listings: only the few favorited rows are indexed
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_favorited_first_seen
+            ON listings(first_seen DESC)
+            WHERE favorited = TRUE
+        """)
+
+        # Price sorts: ORDER BY COALESCE(price, 0), first_seen
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_price_first_seen
+            ON listings(COALESCE(price, 0), first_seen)
+        """)
 
     def listing_exists(self, listing_id: str) -> bool:
         """Check if a listing already exists in the database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn, conn:
             cursor = conn.cursor()
             cursor.execute(
-                "SELECT COUNT(*) FROM listings WHERE listing_id = ?",
+                "SELECT 1 FROM listings WHERE listing_id = ? LIMIT 1",
                 (listing_id,)
             )
-            count = cursor.fetchone()[0]
-            return count > 0
+            return cursor.fetchone() is not None
+
+    def existing_ids(self, listing_ids: Iterable[str]) -> Set[str]:
+        """
+        Return the subset of listing_ids already stored.
+
+        Membership is answered from an in-memory set of stored ids, which is
+        reread whenever data_version shows a commit since it was loaded, so
+        rows deleted by another process are not reported. Ids not in the set
+        are confirmed against the table.
+        """
+        found = set()
+        missing = []
+
+        with self._lock, self._connection() as conn:
+            known = self._load_known_ids(conn)
+            for listing_id in listing_ids:
+                if listing_id in known:
+                    found.add(listing_id)
+                else:
+                    missing.append(listing_id)
+
+            # Stay under SQLite's bound-parameter limit on older builds
+            for start in range(0, len(missing), MAX_IN_PARAMS):
+                chunk = missing[start:start + MAX_IN_PARAMS]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = conn.execute(
+                    f"SELECT listing_id FROM listings WHERE listing_id IN ({placeholders})",
+                    chunk
+                )
+                stored = [row[0] for row in cursor]
+                found.update(stored)
+                known.update(stored)
+
+        return found
+
+    def _load_known_ids(self, conn: sqlite3.Connection) -> Set[str]:
+        """Return the set of stored listing_ids, rereading it after any commit. Caller holds the lock."""
+        # Read the version first: a commit landing during the SELECT then
+        # forces another reload instead of being missed
+        version = self.data_version()
+        if self._known_ids is None or version != self._known_version:
+            cursor = conn.execute("SELECT listing_id FROM listings")
+            self._known_ids = {row[0] for row in cursor}
+            self._known_version = version
+        return self._known_ids
+
+    def _remember_ids(self, listing_ids: Iterable[str]):
+        """Add stored listing_ids to the known set, if it has been loaded."""
+        with self._lock:
+            if self._known_ids is not None:
+                self._known_ids.update(listing_ids)
 
     def add_listing(self, listing: Dict) -> bool:
         """
@@ -126,120 +351,194 @@ class ListingDatabase:
         Returns:
             True if listing was added (new), False if it already existed.
         """
-        if self.listing_exists(listing['listing_id']):
-            # Update last_seen timestamp
-            self._update_last_seen(listing['listing_id'])
-            return False
-
-        with sqlite3.connect(self.db_path) as conn:
+        with self._writer() as conn, conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO listings (
-                    listing_id, url, title, address, neighborhood, price,
-                    bedrooms, bathrooms, square_feet, availability_date, pets_allowed
+            # Inserting first makes the existence check part of the same
+            # statement; a conflict leaves rowcount at 0
+            cursor.execute(_INSERT_LISTING_SQL, _listing_params(listing))
+            inserted = cursor.rowcount > 0
+
+            if not inserted:
+                # Update last_seen timestamp
+                cursor.execute(
+                    "UPDATE listings SET last_seen = CURRENT_TIMESTAMP WHERE listing_id = ?",
+                    (listing['listing_id'],)
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                listing['listing_id'],
-                listing['url'],
-                listing.get('title'),
-                listing.get('address'),
-                listing.get('neighborhood'),
-                listing.get('price'),
-                listing.get('bedrooms'),
-                listing.get('bathrooms'),
-                listing.get('square_feet'),
-                listing.get('availability_date'),
-                listing.get('pets_allowed')
-            ))
-            conn.commit()
-            return True
-
-    def _update_last_seen(self, listing_id: str):
-        """Update the last_seen timestamp for an existing listing."""
-        with sqlite3.connect(self.db_path) as conn:
+
+        # Only once committed, so a rolled-back insert isn't taken as stored
+        self._remember_ids((listing['listing_id'],))
+        return inserted
+
+    def add_listings(self, listings: List[Dict]) -> int:
+        """
+        Add a batch of listings in a single transaction.
+
+        New listings are inserted and existing ones get their last_seen
+        timestamp updated, as with add_listing.
+
+        Returns:
+            Number of listings that were newly inserted.
+        """
+        if not listings:
+            return 0
+
+        with self._writer() as conn, conn:
             cursor = conn.cursor()
-            cursor.execute(
+            cursor.executemany(_INSERT_LISTING_SQL, map(_listing_params, listings))
+            inserted_count = cursor.rowcount
+
+            cursor.executemany(
                 "UPDATE listings SET last_seen = CURRENT_TIMESTAMP WHERE listing_id = ?",
-                (listing_id,)
+                ((listing['listing_id'],) for listing in listings)
             )
-            conn.commit()
+
+        # Only once committed, so a rolled-back batch isn't taken as stored
+        self._remember_ids(listing['listing_id'] for listing in listings)
+        return inserted_count
 
     def mark_as_notified(self, listing_id: str):
         """Mark a listing as having been notified to the user."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._writer() as conn, conn:
             cursor = conn.cursor()
             cursor.execute(
                 "UPDATE listings SET notified = TRUE WHERE listing_id = ?",
                 (listing_id,)
             )
-            conn.commit()
 
-    def get_unnotified_listings(self) -> List[Dict]:
-        """Retrieve all listings that haven't been notified yet."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM listings
-                WHERE notified = FALSE
-                ORDER BY first_seen DESC
-            """)
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+    def _iter_rows(self, query: str, params=()) -> Iterator[tuple]:
+        """
+        Yield query results one row at a time, as namedtuples of the columns.
 
-    def get_all_listings(self, limit: Optional[int] = None) -> List[Dict]:
-        """Retrieve all listings from the database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        The connection stays checked out until the generator is exhausted
+        or closed.
+        """
+        with self._connection() as conn:
             cursor = conn.cursor()
-
-            query = "SELECT * FROM listings ORDER BY first_seen DESC"
-            if limit:
-                query += f" LIMIT {limit}"
-
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            cursor.row_factory = None
+            try:
+                cursor.execute(query, params)
+                row_type = _row_type(tuple(column[0] for column in cursor.description))
+                yield from map(row_type._make, cursor)
+            finally:
+                cursor.close()
+
+    def iter_unnotified_listings(self) -> Iterator[tuple]:
+        """Stream listings that haven't been notified yet, newest first."""
+        return self._iter_rows("""
+            SELECT * FROM listings
+            WHERE notified = FALSE
+            ORDER BY first_seen DESC
+        """)
+
+    def get_unnotified_listings(self) -> List[tuple]:
+        """Retrieve all listings that haven't been notified yet."""
+        return list(self.iter_unnotified_listings())
+
+    def iter_all_listings(self, limit: Optional[int] = None, offset: int = 0,
+                          since: Optional[datetime] = None,
+                          notified: Optional[bool] = None,
+                          order: str = 'newest',
+                          by_neighborhood: bool = False,
+                          after: Optional[Tuple[str, int]] = None) -> Iterator[tuple]:
+        """
+        Stream listings from the database, with an age_s column of seconds
+        since each was first seen.
+
+        Args:
+            limit: Maximum number of listings to return (all if None).
+            offset: Number of listings to skip, for paging.
+            since: Only return listings first seen at or after this UTC time.
+            notified: Only return notified (True) or unnotified (False) listings.
+            order: Sort order, a key of LISTING_ORDERS.
+            by_neighborhood: Return each neighborhood's listings together,
+                sorted by order within it; see _NEIGHBORHOOD_ORDER.
+            after: Keyset cursor from page_cursor() of the previous page's
+                last row. Unlike offset, this costs the same on every page.
+        """
+        conditions = []
+        params = []
+        if after is not None:
+            if by_neighborhood or order not in _KEYSET_CONDITIONS:
+                raise ValueError("Keyset paging supports only the newest and oldest orders, "
+                                 "without by_neighborhood")
+            conditions.append(_KEYSET_CONDITIONS[order])
+            params.extend(after)
+        if since is not None:
+            conditions.append("first_seen >= ?")
+            params.append(since.strftime('%Y-%m-%d %H:%M:%S'))
+        if notified is not None:
+            conditions.append("notified = ?")
+            params.append(notified)
+
+        query = f"SELECT {_LISTING_COLUMNS} FROM listings"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " " + _order_by(order, by_neighborhood)
+
+        if limit or offset:
+            # SQLite needs a LIMIT to apply an OFFSET; -1 means no limit
+            query += " LIMIT ? OFFSET ?"
+            params.extend((limit or -1, offset))
+
+        return self._iter_rows(query, params)
+
+    def get_all_listings(self, limit: Optional[int] = None, offset: int = 0,
+                         since: Optional[datetime] = None,
+                         notified: Optional[bool] = None,
+                         order: str = 'newest',
+                         by_neighborhood: bool = False,
+                         after: Optional[Tuple[str, int]] = None) -> List[tuple]:
+        """Retrieve listings from the database; see iter_all_listings."""
+        return list(self.iter_all_listings(limit, offset, since, notified, order,
+                                           by_neighborhood, after))
 
     def cleanup_old_listings(self, retention_days: int = 30):
         """Remove listings older than the specified number of days."""
         cutoff_date = datetime.now() - timedelta(days=retention_days)
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._writer() as conn, conn:
             cursor = conn.cursor()
             cursor.execute(
                 "DELETE FROM listings WHERE first_seen < ?",
                 (cutoff_date.isoformat(),)
             )
             deleted_count = cursor.rowcount
-            conn.commit()
+
+        if deleted_count:
+            # Reload on next use rather than tracking which ids went away
+            with self._lock:
+                self._known_ids = None
 
         return deleted_count
 
+    def data_version(self) -> int:
+        """
+        Return a token that changes whenever stored listings may have changed.
+
+        PRAGMA data_version moves when a connection other than the one
+        reading it commits. It is read from a connection that never writes,
+        so writes from the pool and from other processes (a scraper run)
+        both count.
+        """
+        with self._version_lock:
+            (version,) = self._version_conn.execute("PRAGMA data_version").fetchone()
+            return version
+
     def get_stats(self) -> Dict:
         """Get database statistics."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn, conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT COUNT(*) FROM listings")
-            total_listings = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM listings WHERE notified = TRUE")
-            notified_listings = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM listings WHERE notified = FALSE")
-            unnotified_listings = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM listings WHERE favorited = TRUE")
-            favorited_listings = cursor.fetchone()[0]
-
-            return {
-                'total_listings': total_listings,
-                'notified_listings': notified_listings,
-                'unnotified_listings': unnotified_listings,
-                'favorited_listings': favorited_listings
-            }
+            # All four counts in one scan; COALESCE keeps an empty table at 0
+            cursor.execute("""
+                SELECT
+                    COUNT(*) AS total_listings,
+                    COALESCE(SUM(notified = TRUE), 0) AS notified_listings,
+                    COALESCE(SUM(notified = FALSE), 0) AS unnotified_listings,
+                    COALESCE(SUM(favorited = TRUE), 0) AS favorited_listings
+                FROM listings
+            """)
+            return dict(cursor.fetchone())
 
     def toggle_favorite(self, listing_id: str) -> bool:
         """
@@ -248,7 +547,7 @@ class ListingDatabase:
         Returns:
             New favorite status (True if now favorited, False if unfavorited)
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._writer() as conn, conn:
             cursor = conn.cursor()
 
             # Get current status
@@ -268,19 +567,19 @@ class ListingDatabase:
                 "UPDATE listings SET favorited = ? WHERE listing_id = ?",
                 (new_status, listing_id)
             )
-            conn.commit()
 
             return new_status
 
-    def get_favorited_listings(self) -> List[Dict]:
+    def iter_favorited_listings(self, order: str = 'newest',
+                                by_neighborhood: bool = False) -> Iterator[tuple]:
+        """Stream favorited listings with their age_s; see iter_all_listings."""
+        return self._iter_rows(f"""
+            SELECT {_LISTING_COLUMNS} FROM listings
+            WHERE favorited = TRUE
+            {_order_by(order, by_neighborhood)}
+        """)
+
+    def get_favorited_listings(self, order: str = 'newest',
+                               by_neighborhood: bool = False) -> List[tuple]:
         """Retrieve all favorited listings."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM listings
-                WHERE favorited = TRUE
-                ORDER BY first_seen DESC
-            """)
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+        return list(self.iter_favorited_listings(order, by_neighborhood))
@@ -136,18 +136,20 @@ class HousingNotificationSystem:
         Returns:
             List of new listings.
         """
+        # One batched membership query instead of a lookup per listing
+        seen_ids = self.db.existing_ids(listing['listing_id'] for listing in listings)
         new_listings = []
 
         for listing in listings:
-            if dry_run:
-                # In dry run, just check without adding
-                if not self.db.listing_exists(listing['listing_id']):
-                    new_listings.append(listing)
-            else:
-                # Add to database, returns True if new
-                is_new = self.db.add_listing(listing)
-                if is_new:
-                    new_listings.append(listing)
+            listing_id = listing['listing_id']
+            if listing_id not in seen_ids:
+                new_listings.append(listing)
+                seen_ids.add(listing_id)
+
+        if not dry_run:
+            # One transaction inserts the new listings and refreshes last_seen
+            # on the ones already tracked
+            self.db.add_listings(listings)
 
         return new_listings
 
@@ -175,13 +177,13 @@ class HousingNotificationSystem:
         print(f"{'=' * 80}\n")
 
         for i, listing in enumerate(listings, 1):
-            print(f"{i}. {listing.get('title', 'Unknown')}")
-            print(f"   Price: ${listing.get('price', 0):,.0f} | "
-                  f"Beds: {listing.get('bedrooms', 'N/A')} | "
-                  f"Baths: {listing.get('bathrooms', 'N/A')}")
-            print(f"   First seen: {listing['first_seen']}")
-            print(f"   Notified: {'Yes' if listing['notified'] else 'No'}")
-            print(f"   URL: {listing['url']}")
+            print(f"{i}. {listing.title}")
+            print(f"   Price: ${listing.price or 0:,.0f} | "
+                  f"Beds: {listing.bedrooms} | "
+                  f"Baths: {listing.bathrooms}")
+            print(f"   First seen: {listing.first_seen}")
+            print(f"   Notified: {'Yes' if listing.notified else 'No'}")
+            print(f"   URL: {listing.url}")
             print()
 
 
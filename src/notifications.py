@@ -3,6 +3,7 @@ Notification module for alerting users about new listings.
 Currently supports console output, designed to be extended for SMS/email.
 """
 
+import sys
 import logging
 from typing import List, Dict
 from datetime import datetime
@@ -13,6 +14,12 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _write_lines(lines: List[str]):
+    """Write a report to stdout in one call, as if each line had been printed."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 class NotificationService:
     """Manages notifications for new housing listings."""
 
@@ -67,22 +74,24 @@ class NotificationService:
         Returns:
             Number of listings notified.
         """
-        print("\n" + "=" * 80)
-        print(f"🏠 NEW HOUSING LISTINGS FOUND - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("=" * 80 + "\n")
+        lines = [
+            "\n" + "=" * 80,
+            f"🏠 NEW HOUSING LISTINGS FOUND - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "=" * 80 + "\n",
+        ]
 
         for i, listing in enumerate(listings, 1):
-            print(f"Listing #{i}")
-            print("-" * 80)
+            lines.append(f"Listing #{i}")
+            lines.append("-" * 80)
 
             if listing.get('title'):
-                print(f"Property: {listing['title']}")
+                lines.append(f"Property: {listing['title']}")
 
             if listing.get('address'):
-                print(f"Address: {listing['address']}")
+                lines.append(f"Address: {listing['address']}")
 
             if listing.get('price'):
-                print(f"Price: ${listing['price']:,.0f}/month")
+                lines.append(f"Price: ${listing['price']:,.0f}/month")
 
             # Bedrooms and Bathrooms
             bed_bath = []
@@ -98,23 +107,24 @@ class NotificationService:
                 bed_bath.append(f"{baths} bath")
 
             if bed_bath:
-                print(f"Layout: {', '.join(bed_bath)}")
+                lines.append(f"Layout: {', '.join(bed_bath)}")
 
             if listing.get('square_feet'):
-                print(f"Size: {listing['square_feet']:,.0f} sq ft")
+                lines.append(f"Size: {listing['square_feet']:,.0f} sq ft")
 
             if listing.get('availability_date'):
-                print(f"Available: {listing['availability_date']}")
+                lines.append(f"Available: {listing['availability_date']}")
 
             if listing.get('url'):
-                print(f"URL: {listing['url']}")
+                lines.append(f"URL: {listing['url']}")
 
-            print()
+            lines.append("")
 
-        print("=" * 80)
-        print(f"Total new listings: {len(listings)}")
-        print("=" * 80 + "\n")
+        lines.append("=" * 80)
+        lines.append(f"Total new listings: {len(listings)}")
+        lines.append("=" * 80 + "\n")
 
+        _write_lines(lines)
         return len(listings)
 
     def _send_sms_notification(self, listings: List[Dict]) -> int:
@@ -184,14 +194,16 @@ class NotificationService:
             new_found: Number of new listings found
             filtered_out: Number of listings filtered out
         """
-        print("\n" + "-" * 80)
-        print(f"📊 SCRAPING SUMMARY - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("-" * 80)
-        print(f"Total listings checked: {total_checked}")
-        print(f"New listings found: {new_found}")
-        print(f"Filtered out (didn't match criteria): {filtered_out}")
-        print(f"Listings meeting criteria: {new_found - filtered_out}")
-        print("-" * 80 + "\n")
+        _write_lines([
+            "\n" + "-" * 80,
+            f"📊 SCRAPING SUMMARY - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "-" * 80,
+            f"Total listings checked: {total_checked}",
+            f"New listings found: {new_found}",
+            f"Filtered out (didn't match criteria): {filtered_out}",
+            f"Listings meeting criteria: {new_found - filtered_out}",
+            "-" * 80 + "\n",
+        ])
 
 
 # Example future SMS implementation with Twilio (commented out):
@@ -6,7 +6,14 @@ Uses Selenium for JavaScript-rendered content.
 
 import undetected_chromedriver as uc
 from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+import lxml.html
+from lxml import etree
+from cssselect import HTMLTranslator
+import threading
 import time
 import logging
 from typing import List, Dict, Optional
@@ -17,6 +24,7 @@ import random
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from src.config import Config
+from src.slug import slugify
 
 
 # Set up logging
@@ -24,12 +32,113 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+_translator = HTMLTranslator()
+
+
+def _css(selector: str, prefix: str = 'descendant-or-self::') -> etree.XPath:
+    """Compile a CSS selector to an lxml XPath evaluator."""
+    return etree.XPath(_translator.css_to_xpath(selector, prefix=prefix))
+
+
+def _css_in(selector: str) -> etree.XPath:
+    """Compile a selector that, like BeautifulSoup's select, skips the element itself."""
+    return _css(selector, prefix='descendant::')
+
+
+def _first(selector: etree.XPath, elem):
+    """Return the first match of a compiled selector, or None."""
+    matches = selector(elem)
+    return matches[0] if matches else None
+
+
+def _text(elem) -> str:
+    """Return the element's stripped text, matching BeautifulSoup's get_text(strip=True)."""
+    return ''.join(s.strip() for s in elem.itertext())
+
+
+# Search results page
+_LISTING_CONTAINERS = _css('article.placard')
+_FALLBACK_CONTAINERS = _css('[data-listingid], li.mortar-wrapper')
+
+# Fields within a listing container. One walk over the card collects every
+# element whose class could belong to a field, in document order; _CARD_FIELDS
+# then assigns each to the fields whose selector it matches.
+_LISTING_FIELD_CANDIDATES = etree.XPath(
+    "descendant::*[contains(@class, 'property-') or contains(@class, 'TextBox')"
+    " or contains(@class, 'bath') or contains(@class, 'sqft')"
+    " or contains(@class, 'square-feet') or contains(@class, 'avail')]"
+)
+
+# (field, test on tag, class attribute and class tokens), equivalent to the
+# selectors a.property-link, .property-title, .property-address, .priceTextBox,
+# .bedTextBox, [class*="bath"], .square-feet/[class*="sqft"] and [class*="avail"]
+_CARD_FIELDS = (
+    ('url', lambda tag, cls, tokens: tag == 'a' and 'property-link' in tokens),
+    ('title', lambda tag, cls, tokens: 'property-title' in tokens),
+    ('address', lambda tag, cls, tokens: 'property-address' in tokens),
+    ('price', lambda tag, cls, tokens: 'priceTextBox' in tokens),
+    ('bedrooms', lambda tag, cls, tokens: 'bedTextBox' in tokens),
+    ('bathrooms', lambda tag, cls, tokens: 'bath' in cls),
+    ('square_feet', lambda tag, cls, tokens: 'sqft' in cls or 'square-feet' in tokens),
+    ('availability_date', lambda tag, cls, tokens: 'avail' in cls),
+)
+
+
+def _card_fields(container) -> Dict[str, object]:
+    """Return the first element for each listing field, from one walk over the card."""
+    found = {}
+    for elem in _LISTING_FIELD_CANDIDATES(container):
+        cls = elem.get('class', '')
+        tokens = cls.split()
+        for field, matches in _CARD_FIELDS:
+            if field not in found and matches(elem.tag, cls, tokens):
+                found[field] = elem
+    return found
+
+
+# Elements whose presence means a page has rendered enough to parse. The
+# detail page's h1 is static, so only the rendered price block counts.
+_SEARCH_READY_SELECTOR = 'article.placard, [data-listingid], li.mortar-wrapper'
+_DETAIL_READY_SELECTOR = '.priceBedRangeInfo'
+
+# Fixed wait used without a ready selector, and the longest wait for one.
+# Pages that never match (an empty last page, no results) wait the full
+# timeout, so it is no longer than the fixed wait.
+PAGE_RENDER_DELAY = 5
+PAGE_RENDER_TIMEOUT = PAGE_RENDER_DELAY
+
+# Listing detail page
+_DETAIL_PRICE = _css('span.propertyName.propertyNamePropRes')
+_DETAIL_ADDRESS = _css('h1')
+_DETAIL_BED_BATH_ITEMS = _css('.priceBedRangeInfo li')
+_DETAIL_PETS = _css('.component-body.pet-fees')
+
+# Field parsing patterns, compiled once for every listing parsed
+_URL_ID_RE = re.compile(r'/([a-z0-9]+)/?$')
+_PRICE_CLEAN_RE = re.compile(r'[^\d.]')
+_NUM_RE = re.compile(r'\d+\.?\d*')
+_STUDIO_RE = re.compile('studio', re.IGNORECASE)
+
+
+class ScrapeAborted(Exception):
+    """Raised inside a scrape after ApartmentsScraper.abort() was called."""
+
+
+class _ScrapeControl:
+    """Abort flag and open browsers, shared by a scraper and its per-neighborhood workers."""
+
+    def __init__(self):
+        self.aborted = threading.Event()
+        self.lock = threading.Lock()
+        self.drivers = set()
+
+
 class ApartmentsScraper:
     """Scraper for Apartments.com housing listings."""
 
     BASE_URL = "https://www.apartments.com"
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, _control: Optional[_ScrapeControl] = None):
         """
         Initialize scraper with configuration.
 
@@ -38,11 +147,44 @@ class ApartmentsScraper:
         """
         self.config = config
         self.driver = None
+        self._control = _control or _ScrapeControl()
+
+    def abort(self):
+        """
+        Stop a scrape running on another thread.
+
+        Every browser the scrape has open is quit, so in-flight page loads
+        fail and the scrape unwinds through its usual cleanup, raising
+        ScrapeAborted. No new browsers or retries are started afterwards.
+        """
+        control = self._control
+        control.aborted.set()
+        with control.lock:
+            drivers = list(control.drivers)
+            control.drivers.clear()
+
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.warning(f"Error closing Chrome WebDriver: {e}")
+        logger.info("Scrape aborted")
+
+    def _check_aborted(self):
+        """Raise ScrapeAborted if abort() has been called."""
+        if self._control.aborted.is_set():
+            raise ScrapeAborted("Scrape aborted")
+
+    def _sleep(self, seconds: float):
+        """Sleep between requests, cut short by abort()."""
+        if self._control.aborted.wait(seconds):
+            raise ScrapeAborted("Scrape aborted")
 
     def _init_driver(self):
         """Initialize Undetected Chrome WebDriver (bypasses bot detection)."""
         if self.driver is not None:
             return
+        self._check_aborted()
 
         chrome_options = uc.ChromeOptions()
         chrome_options.add_argument('--no-sandbox')
@@ -61,19 +203,28 @@ class ApartmentsScraper:
             )
             mode = "headless" if self.config.headless else "visible"
             logger.info(f"✓ Undetected Chrome WebDriver initialized ({mode} mode)")
-            # Give driver a moment to stabilize
-            time.sleep(1)
         except Exception as e:
             logger.error(f"Failed to initialize Chrome WebDriver: {e}")
             logger.error("Make sure Chrome browser is installed")
             raise
 
+        with self._control.lock:
+            self._control.drivers.add(self.driver)
+
+        # Give driver a moment to stabilize
+        self._sleep(1)
+
     def _close_driver(self):
         """Close Selenium WebDriver."""
         if self.driver:
-            self.driver.quit()
-            self.driver = None
-            logger.info("✓ Chrome WebDriver closed")
+            driver, self.driver = self.driver, None
+            with self._control.lock:
+                # abort() quits and forgets the drivers it closes
+                owned = driver in self._control.drivers
+                self._control.drivers.discard(driver)
+            if owned:
+                driver.quit()
+                logger.info("✓ Chrome WebDriver closed")
 
     def build_search_url(self, location: str, page: int = 1, neighborhood: str = None) -> str:
         """
@@ -90,17 +241,13 @@ class ApartmentsScraper:
             Full search URL with filters in path
         """
         # Clean and format location for URL
-        location_slug = location.lower()
-        location_slug = re.sub(r'[^\w\s-]', '', location_slug)
-        location_slug = re.sub(r'[\s_]+', '-', location_slug)
+        location_slug = slugify(location)
 
         # If neighborhood is specified, Apartments.com format is:
         # /neighborhood-city-state/ (e.g., /lincoln-park-chicago-il/)
         # Otherwise just: /city-state/ (e.g., /chicago-il/)
         if neighborhood:
-            neighborhood_slug = neighborhood.lower()
-            neighborhood_slug = re.sub(r'[^\w\s-]', '', neighborhood_slug)
-            neighborhood_slug = re.sub(r'[\s_]+', '-', neighborhood_slug)
+            neighborhood_slug = slugify(neighborhood)
             # Combine neighborhood with location
             base_location = f"{neighborhood_slug}-{location_slug}"
         else:
@@ -152,13 +299,16 @@ class ApartmentsScraper:
 
         return url
 
-    def fetch_page(self, url: str, retry_count: int = 0) -> Optional[str]:
+    def fetch_page(self, url: str, retry_count: int = 0,
+                   wait_selector: Optional[str] = None) -> Optional[str]:
         """
         Fetch a web page using Selenium with retry logic.
 
         Args:
             url: URL to fetch
             retry_count: Current retry attempt
+            wait_selector: CSS selector to wait for before reading the page;
+                without one, a fixed delay is used instead
 
         Returns:
             HTML content or None if failed
@@ -171,7 +321,15 @@ class ApartmentsScraper:
 
             # Wait for JavaScript to render (listings are dynamically loaded)
             logger.info("Waiting for page to render...")
-            time.sleep(5)  # Give JavaScript time to load
+            if wait_selector:
+                try:
+                    WebDriverWait(self.driver, PAGE_RENDER_TIMEOUT).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector))
+                    )
+                except TimeoutException:
+                    logger.warning(f"Timed out waiting for '{wait_selector}', using page as loaded")
+            else:
+                self._sleep(PAGE_RENDER_DELAY)  # Give JavaScript time to load
 
             html = self.driver.page_source
             logger.info(f"✓ Page loaded ({len(html):,} characters)")
@@ -179,6 +337,8 @@ class ApartmentsScraper:
             return html
 
         except Exception as e:
+            # Page loads fail once abort() quits the browser; don't retry those
+            self._check_aborted()
             logger.error(f"Error fetching {url}: {e}")
 
             # Close the driver if it's in a bad state
@@ -187,8 +347,8 @@ class ApartmentsScraper:
             if retry_count < self.config.max_retries:
                 wait_time = 2 ** retry_count  # Exponential backoff
                 logger.info(f"Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
-                return self.fetch_page(url, retry_count + 1)
+                self._sleep(wait_time)
+                return self.fetch_page(url, retry_count + 1, wait_selector)
 
             return None
 
@@ -204,16 +364,18 @@ class ApartmentsScraper:
         Returns:
             List of parsed listing dictionaries
         """
-        soup = BeautifulSoup(html, 'lxml')
+        tree = lxml.html.document_fromstring(html)
         listings = []
 
-        # Apartments.com uses article.placard for listing containers
-        listing_containers = soup.select('article.placard')
+        # Apartments.com uses article.placard for listing containers. The
+        # fallback also matches each placard's wrapping li, so it is only
+        # used when the primary finds nothing.
+        listing_containers = _LISTING_CONTAINERS(tree)
 
         if not listing_containers:
             logger.warning("No listing containers found. HTML structure may have changed.")
             # Try alternative selectors
-            listing_containers = soup.select('[data-listingid], li.mortar-wrapper')
+            listing_containers = _FALLBACK_CONTAINERS(tree)
 
         logger.info(f"Found {len(listing_containers)} potential listings")
 
@@ -233,7 +395,7 @@ class ApartmentsScraper:
         Parse a single listing from its HTML container.
 
         Args:
-            container: BeautifulSoup element containing listing data
+            container: lxml element containing listing data
             base_url: Base URL for resolving relative links
             neighborhood: Optional neighborhood name for tracking
 
@@ -241,11 +403,12 @@ class ApartmentsScraper:
             Listing dictionary or None if parsing failed
         """
         listing = {}
+        fields = _card_fields(container)
 
         # Extract URL
-        url_elem = container.select_one('a.property-link')
-        if url_elem and url_elem.get('href'):
-            listing['url'] = urljoin(base_url, url_elem['href'])
+        url_elem = fields.get('url')
+        if url_elem is not None and url_elem.get('href'):
+            listing['url'] = urljoin(base_url, url_elem.get('href'))
         else:
             logger.warning("No URL found for listing, skipping")
             return None
@@ -254,54 +417,37 @@ class ApartmentsScraper:
         listing['listing_id'] = self._generate_listing_id(listing['url'])
 
         # Extract title/property name
-        title_elem = container.select_one('.property-title')
-        listing['title'] = title_elem.get_text(strip=True) if title_elem else None
+        title_elem = fields.get('title')
+        listing['title'] = _text(title_elem) if title_elem is not None else None
 
         # Extract address
-        address_elem = container.select_one('.property-address')
-        listing['address'] = address_elem.get_text(strip=True) if address_elem else None
+        address_elem = fields.get('address')
+        listing['address'] = _text(address_elem) if address_elem is not None else None
 
         # Store neighborhood if provided
         listing['neighborhood'] = neighborhood
 
         # Extract price - Apartments.com uses .priceTextBox for prices
-        # There may be multiple prices for different bedroom counts
-        price_elems = container.select('.priceTextBox')
-        if price_elems:
-            # Get the first (usually lowest) price
-            price_text = price_elems[0].get_text(strip=True)
-            listing['price'] = self._parse_price(price_text)
-        else:
-            listing['price'] = None
+        # There may be multiple prices for different bedroom counts;
+        # the first is usually the lowest
+        price_elem = fields.get('price')
+        listing['price'] = self._parse_price(_text(price_elem)) if price_elem is not None else None
 
         # Extract bedrooms - Apartments.com uses .bedTextBox
-        bed_elems = container.select('.bedTextBox')
-        if bed_elems:
-            # Get the first bedroom count
-            bed_text = bed_elems[0].get_text(strip=True)
-            listing['bedrooms'] = self._parse_number(bed_text)
-        else:
-            listing['bedrooms'] = None
+        bed_elem = fields.get('bedrooms')
+        listing['bedrooms'] = self._parse_number(_text(bed_elem)) if bed_elem is not None else None
 
         # Extract bathrooms - Less commonly displayed on listing cards
-        bath_elem = container.select_one('.bath-range, .baths, [class*="bath"]')
-        if bath_elem:
-            bath_text = bath_elem.get_text(strip=True)
-            listing['bathrooms'] = self._parse_number(bath_text)
-        else:
-            listing['bathrooms'] = None
+        bath_elem = fields.get('bathrooms')
+        listing['bathrooms'] = self._parse_number(_text(bath_elem)) if bath_elem is not None else None
 
         # Extract square feet
-        sqft_elem = container.select_one('.sqft, .square-feet, [class*="sqft"]')
-        if sqft_elem:
-            sqft_text = sqft_elem.get_text(strip=True)
-            listing['square_feet'] = self._parse_number(sqft_text)
-        else:
-            listing['square_feet'] = None
+        sqft_elem = fields.get('square_feet')
+        listing['square_feet'] = self._parse_number(_text(sqft_elem)) if sqft_elem is not None else None
 
         # Extract availability date
-        avail_elem = container.select_one('.availability, .available-date, [class*="avail"]')
-        listing['availability_date'] = avail_elem.get_text(strip=True) if avail_elem else None
+        avail_elem = fields.get('availability_date')
+        listing['availability_date'] = _text(avail_elem) if avail_elem is not None else None
 
         return listing
 
@@ -309,12 +455,13 @@ class ApartmentsScraper:
         """Generate a unique listing ID from URL."""
         # Extract any existing ID from URL
         # Apartments.com URLs look like: /property-name-city-state/listing-id/
-        id_match = re.search(r'/([a-z0-9]+)/?$', url)
+        id_match = _URL_ID_RE.search(url)
         if id_match:
             return id_match.group(1)
 
-        # Fallback: hash the URL
-        return hashlib.md5(url.encode()).hexdigest()[:16]
+        # Fallback: hash the URL. The ID is only a database key, so a short
+        # blake2b digest does; it is the same 16 hex characters long as before.
+        return hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
 
     def _parse_price(self, price_text: str) -> Optional[float]:
         """
@@ -325,14 +472,12 @@ class ApartmentsScraper:
         Returns the minimum price if a range is given.
         """
         # Remove non-numeric characters except digits and decimal points
-        cleaned = re.sub(r'[^\d.]', '', price_text)
-
-        # Find all numbers
-        numbers = re.findall(r'\d+\.?\d*', cleaned)
+        cleaned = _PRICE_CLEAN_RE.sub('', price_text)
 
-        if numbers:
-            # Return the first (minimum) price
-            return float(numbers[0])
+        # Only the first (minimum) price is used, so stop at the first number
+        match = _NUM_RE.search(cleaned)
+        if match:
+            return float(match.group())
 
         return None
 
@@ -343,31 +488,37 @@ class ApartmentsScraper:
         Examples: "2 Beds", "1.5 Baths", "Studio", "800 sq ft"
         """
         # Handle "Studio" as 0 bedrooms
-        if 'studio' in text.lower():
+        if _STUDIO_RE.search(text):
             return 0
 
         # Find the first number (including decimals)
-        match = re.search(r'\d+\.?\d*', text)
+        match = _NUM_RE.search(text)
         if match:
             return float(match.group())
 
         return None
 
-    def _scrape_single_neighborhood(self, location: str, neighborhood: Optional[str], max_pages: int) -> List[Dict]:
+    def _scrape_single_neighborhood(self, location: str, neighborhood: Optional[str], max_pages: int,
+                                    scraper: Optional['ApartmentsScraper'] = None) -> List[Dict]:
         """
         Scrape a single neighborhood (or entire location if neighborhood is None).
-        This method creates its own driver instance for parallel execution.
+        Unless a scraper is passed in, this method creates its own driver
+        instance for parallel execution.
 
         Args:
             location: Location string (e.g., "Chicago, IL")
             neighborhood: Optional neighborhood name
             max_pages: Maximum number of pages to scrape
+            scraper: Optional scraper whose browser session should be reused;
+                the caller remains responsible for closing it
 
         Returns:
             List of listings for this neighborhood
         """
         # Create a new scraper instance with its own driver for parallel execution
-        scraper = ApartmentsScraper(self.config)
+        owns_scraper = scraper is None
+        if owns_scraper:
+            scraper = ApartmentsScraper(self.config, _control=self._control)
 
         try:
             if neighborhood:
@@ -377,7 +528,7 @@ class ApartmentsScraper:
 
             for page in range(1, max_pages + 1):
                 url = scraper.build_search_url(location, page, neighborhood)
-                html = scraper.fetch_page(url)
+                html = scraper.fetch_page(url, wait_selector=_SEARCH_READY_SELECTOR)
 
                 if not html:
                     logger.warning(f"[{neighborhood or 'all'}] Failed to fetch page {page}, stopping pagination")
@@ -394,7 +545,7 @@ class ApartmentsScraper:
 
                 # Rate limiting between pages
                 if page < max_pages:
-                    time.sleep(3)
+                    scraper._sleep(3)
 
             # Log neighborhood summary
             if neighborhood:
@@ -403,8 +554,9 @@ class ApartmentsScraper:
             return neighborhood_listings
 
         finally:
-            # Always close the browser for this neighborhood
-            scraper._close_driver()
+            # Close the browser if it was started just for this neighborhood
+            if owns_scraper:
+                scraper._close_driver()
 
     def scrape_listings(self, max_pages: int = 3) -> List[Dict]:
         """
@@ -434,8 +586,9 @@ class ApartmentsScraper:
         if self.config.parallel_neighborhoods and len(search_targets) > 1:
             logger.info(f"Using parallel scraping for {len(search_targets)} neighborhoods")
 
-            # Use ThreadPoolExecutor for parallel scraping
-            with ThreadPoolExecutor(max_workers=len(search_targets)) as executor:
+            # Each worker drives its own browser, so cap how many run at once
+            max_workers = max(1, min(self.config.max_parallel_browsers, len(search_targets)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 # Submit all neighborhood scraping tasks
                 future_to_neighborhood = {
                     executor.submit(self._scrape_single_neighborhood, loc, neighborhood, max_pages): neighborhood
@@ -448,20 +601,25 @@ class ApartmentsScraper:
                     try:
                         listings = future.result()
                         all_listings.extend(listings)
+                    except ScrapeAborted:
+                        raise
                     except Exception as e:
                         logger.error(f"Error scraping neighborhood '{neighborhood}': {e}")
 
         else:
-            # Sequential scraping (original behavior)
+            # Sequential scraping reuses this scraper's browser across neighborhoods
             try:
                 for location, neighborhood in search_targets:
-                    neighborhood_listings = self._scrape_single_neighborhood(location, neighborhood, max_pages)
+                    self._check_aborted()
+                    neighborhood_listings = self._scrape_single_neighborhood(
+                        location, neighborhood, max_pages, scraper=self
+                    )
                     all_listings.extend(neighborhood_listings)
 
                     # Wait between neighborhoods in sequential mode
                     if len(search_targets) > 1 and (location, neighborhood) != search_targets[-1]:
                         logger.info("Waiting before next neighborhood...")
-                        time.sleep(5)
+                        self._sleep(5)
 
             finally:
                 # Close driver if it was used
@@ -470,12 +628,14 @@ class ApartmentsScraper:
         logger.info(f"Scraping complete. Total listings found: {len(all_listings)}")
         return all_listings
 
-    def scrape_listing_details(self, url: str) -> Optional[Dict]:
+    def scrape_listing_details(self, url: str, close_driver: bool = True) -> Optional[Dict]:
         """
         Scrape detailed information from an individual listing page.
 
         Args:
             url: URL of the individual listing
+            close_driver: Close the browser afterwards; pass False when
+                scraping several detail pages in a row
 
         Returns:
             Dictionary with detailed listing information, or None if failed
@@ -483,28 +643,28 @@ class ApartmentsScraper:
         try:
             self._init_driver()
 
-            html = self.fetch_page(url)
+            html = self.fetch_page(url, wait_selector=_DETAIL_READY_SELECTOR)
             if not html:
                 return None
 
-            soup = BeautifulSoup(html, 'lxml')
+            tree = lxml.html.document_fromstring(html)
             details = {}
 
             # Extract price from detail page
-            price_elem = soup.select_one('span.propertyName.propertyNamePropRes')
-            if price_elem:
-                price_text = price_elem.get_text(strip=True)
+            price_elem = _first(_DETAIL_PRICE, tree)
+            if price_elem is not None:
+                price_text = _text(price_elem)
                 details['price'] = self._parse_price(price_text)
 
             # Extract address from h1
-            address_elem = soup.select_one('h1')
-            if address_elem:
-                details['address'] = address_elem.get_text(strip=True)
+            address_elem = _first(_DETAIL_ADDRESS, tree)
+            if address_elem is not None:
+                details['address'] = _text(address_elem)
 
             # Extract bedrooms and bathrooms from priceBedRangeInfo
-            bed_bath_items = soup.select('.priceBedRangeInfo li')
+            bed_bath_items = _DETAIL_BED_BATH_ITEMS(tree)
             for item in bed_bath_items:
-                text = item.get_text(strip=True)
+                text = _text(item)
                 if text.startswith('Bedrooms'):
                     bed_text = text.replace('Bedrooms', '')
                     details['bedrooms'] = self._parse_number(bed_text)
@@ -516,19 +676,22 @@ class ApartmentsScraper:
                     details['square_feet'] = self._parse_number(sqft_text)
 
             # Extract pet policy
-            pet_elem = soup.select_one('.component-body.pet-fees')
-            if pet_elem:
-                pet_text = pet_elem.get_text(strip=True)
+            pet_elem = _first(_DETAIL_PETS, tree)
+            if pet_elem is not None:
+                pet_text = _text(pet_elem)
                 details['pets_allowed'] = 'Allowed' in pet_text or 'Dogs' in pet_text or 'Cats' in pet_text
 
             logger.info(f"Detail scrape successful for {url}")
             return details
 
+        except ScrapeAborted:
+            raise
         except Exception as e:
             logger.error(f"Error scraping details from {url}: {e}")
             return None
         finally:
-            self._close_driver()
+            if close_driver:
+                self._close_driver()
 
     def enrich_listings_with_details(self, listings: List[Dict]) -> List[Dict]:
         """
@@ -542,41 +705,45 @@ class ApartmentsScraper:
         """
         enriched_count = 0
 
-        for listing in listings:
-            # Check if listing needs enrichment (missing price or bedrooms)
-            needs_enrichment = (
-                listing.get('price') is None or
-                listing.get('bedrooms') is None or
-                listing.get('address') is None
-            )
-
-            if needs_enrichment:
-                logger.info(f"Enriching listing: {listing.get('title', 'Unknown')}")
-                details = self.scrape_listing_details(listing['url'])
-
-                if details:
-                    # Update listing with details
-                    if 'price' in details and details['price']:
-                        listing['price'] = details['price']
-                    if 'bedrooms' in details and details['bedrooms']:
-                        listing['bedrooms'] = details['bedrooms']
-                    if 'bathrooms' in details and details['bathrooms']:
-                        listing['bathrooms'] = details['bathrooms']
-                    if 'address' in details and details['address']:
-                        listing['address'] = details['address']
-                    if 'square_feet' in details and details['square_feet']:
-                        listing['square_feet'] = details['square_feet']
-                    if 'pets_allowed' in details:
-                        listing['pets_allowed'] = details['pets_allowed']
-
-                    enriched_count += 1
-
-                # Rate limiting with random jitter to avoid bot detection
-                delay = random.uniform(
-                    self.config.detail_page_delay_min,
-                    self.config.detail_page_delay_max
+        # Keep one browser session open across all detail pages
+        try:
+            for listing in listings:
+                # Check if listing needs enrichment (missing price or bedrooms)
+                needs_enrichment = (
+                    listing.get('price') is None or
+                    listing.get('bedrooms') is None or
+                    listing.get('address') is None
                 )
-                time.sleep(delay)
+
+                if needs_enrichment:
+                    logger.info(f"Enriching listing: {listing.get('title', 'Unknown')}")
+                    details = self.scrape_listing_details(listing['url'], close_driver=False)
+
+                    if details:
+                        # Update listing with details
+                        if 'price' in details and details['price']:
+                            listing['price'] = details['price']
+                        if 'bedrooms' in details and details['bedrooms']:
+                            listing['bedrooms'] = details['bedrooms']
+                        if 'bathrooms' in details and details['bathrooms']:
+                            listing['bathrooms'] = details['bathrooms']
+                        if 'address' in details and details['address']:
+                            listing['address'] = details['address']
+                        if 'square_feet' in details and details['square_feet']:
+                            listing['square_feet'] = details['square_feet']
+                        if 'pets_allowed' in details:
+                            listing['pets_allowed'] = details['pets_allowed']
+
+                        enriched_count += 1
+
+                    # Rate limiting with random jitter to avoid bot detection
+                    delay = random.uniform(
+                        self.config.detail_page_delay_min,
+                        self.config.detail_page_delay_max
+                    )
+                    self._sleep(delay)
+        finally:
+            self._close_driver()
 
         logger.info(f"Enriched {enriched_count} listings with detail page data")
         return listings
@@ -0,0 +1,32 @@
+"""
+URL slug helpers shared by the scraper and debug scripts.
+Converts locations and neighborhoods into Apartments.com path segments.
+"""
+
+import re
+from functools import lru_cache
+
+
+# Compiled once so repeated slugging skips the re module's pattern cache
+_SLUG_PUNCT = re.compile(r'[^\w\s-]')
+_SLUG_WS = re.compile(r'[\s_]+')
+
+
+# Locations and neighborhoods repeat across pages and runs, so each
+# distinct name is slugged only once
+@lru_cache(maxsize=None)
+def slugify(text: str) -> str:
+    """
+    Convert text into a URL slug.
+
+    Example:
+        slugify("Chicago, IL") -> "chicago-il"
+
+    Args:
+        text: Location or neighborhood name.
+
+    Returns:
+        Lowercase slug with punctuation removed and whitespace collapsed to dashes.
+    """
+    slug = _SLUG_PUNCT.sub('', text.lower())
+    return _SLUG_WS.sub('-', slug)
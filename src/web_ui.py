@@ -3,16 +3,18 @@ Web UI for viewing and managing scraped housing listings.
 Simple Flask application for tracking and favoriting listings.
 """
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for
-from datetime import datetime
-from typing import List, Dict
+from flask import (
+    Blueprint, Flask, Response, current_app, render_template, request, jsonify, redirect, url_for
+)
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
+import gzip
+from typing import List, Dict, Optional
 import os
-import sys
+import time
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from src.database import ListingDatabase
+from src.database import ListingDatabase, LISTING_ORDERS
 from src.config import Config
 
 # Get the parent directory (project root) for templates and static files
@@ -20,27 +22,44 @@ parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 template_dir = os.path.join(parent_dir, 'templates')
 static_dir = os.path.join(parent_dir, 'static')
 
-app = Flask(__name__, template_folder=template_dir, static_folder=static_dir)
+bp = Blueprint('web_ui', __name__)
+
 
-# Initialize database
-config = Config()
-db = ListingDatabase(config.db_path)
+def create_app(config: Optional[Config] = None) -> Flask:
+    """
+    Create the web UI app.
 
+    Args:
+        config: Configuration to use; loaded from config.json if omitted.
 
-def calculate_duration(first_seen_str: str) -> Dict:
+    Returns:
+        Flask app serving the listings database at config.db_path.
     """
-    Calculate how long a listing has been tracked.
+    if config is None:
+        config = Config()
+
+    app = Flask(__name__, template_folder=template_dir, static_folder=static_dir)
+    app.config['DB'] = ListingDatabase(config.db_path)
+    app.register_blueprint(bp)
+    return app
+
 
-    Returns dict with human-readable duration and color code.
+@bp.app_template_filter('duration')
+def bucket_duration(age_s: int) -> Dict:
     """
-    first_seen = datetime.fromisoformat(first_seen_str)
-    now = datetime.now()
-    delta = now - first_seen
+    Describe how long a listing has been tracked, given its age in seconds.
+
+    Returns dict with human-readable duration and color code. Listings of
+    the same age in minutes share one dict, so treat it as read-only.
+    """
+    return _minutes_duration(age_s // 60)
 
-    # Calculate duration
-    days = delta.days
-    hours = delta.seconds // 3600
-    minutes = (delta.seconds % 3600) // 60
+
+@lru_cache(maxsize=4096)
+def _minutes_duration(age_min: int) -> Dict:
+    """Build the duration dict for an age in whole minutes."""
+    days, rem = divmod(age_min, 1440)
+    hours, minutes = divmod(rem, 60)
 
     # Format human-readable string
     if days > 0:
@@ -61,40 +80,43 @@ def calculate_duration(first_seen_str: str) -> Dict:
     }
 
 
-@app.route('/')
+@bp.route('/')
 def index():
     """Main listings page."""
     # Get filter and sort parameters
     show_favorites = request.args.get('favorites', 'false') == 'true'
     sort_by = request.args.get('sort', 'newest')
 
-    # Get listings
+    # Durations are shown to the minute, so a rendered page stays valid
+    # until the data changes or the minute turns over
+    db = current_app.config['DB']
+    html = _render_index(db, show_favorites, sort_by, db.data_version(), int(time.time() // 60))
+
+    if request.accept_encodings['gzip']:
+        response = Response(_gzip_page(html), mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(html, mimetype='text/html')
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+@lru_cache(maxsize=16)
+def _render_index(db: ListingDatabase, show_favorites: bool, sort_by: str,
+                  data_version, minute: int) -> str:
+    """Render the listings page; cached on the arguments."""
+    # The query returns each neighborhood's listings together, sorted
+    order = sort_by if sort_by in LISTING_ORDERS else 'newest'
     if show_favorites:
-        listings = db.get_favorited_listings()
+        listings = db.iter_favorited_listings(order, by_neighborhood=True)
     else:
-        listings = db.get_all_listings()
-
-    # Sort listings
-    if sort_by == 'newest':
-        listings.sort(key=lambda x: x['first_seen'], reverse=True)
-    elif sort_by == 'oldest':
-        listings.sort(key=lambda x: x['first_seen'])
-    elif sort_by == 'price_high':
-        listings.sort(key=lambda x: x['price'] or 0, reverse=True)
-    elif sort_by == 'price_low':
-        listings.sort(key=lambda x: x['price'] or 0)
-
-    # Add duration to each listing
-    for listing in listings:
-        listing['duration'] = calculate_duration(listing['first_seen'])
+        listings = db.iter_all_listings(order=order, by_neighborhood=True)
 
     # Group listings by neighborhood
-    neighborhoods = {}
-    for listing in listings:
-        neighborhood = listing.get('neighborhood') or 'Unknown'
-        if neighborhood not in neighborhoods:
-            neighborhoods[neighborhood] = []
-        neighborhoods[neighborhood].append(listing)
+    neighborhoods = {
+        neighborhood: list(group)
+        for neighborhood, group in groupby(listings, key=attrgetter('neighborhood_group'))
+    }
 
     # Get stats
     stats = db.get_stats()
@@ -108,18 +130,28 @@ def index():
     )
 
 
-@app.route('/toggle_favorite/<listing_id>', methods=['POST'])
+@lru_cache(maxsize=16)
+def _gzip_page(html: str) -> bytes:
+    """Gzip a rendered page; cached alongside _render_index."""
+    return gzip.compress(html.encode('utf-8'), compresslevel=6)
+
+
+@bp.route('/toggle_favorite/<listing_id>', methods=['POST'])
 def toggle_favorite(listing_id):
     """Toggle favorite status of a listing."""
-    new_status = db.toggle_favorite(listing_id)
+    new_status = current_app.config['DB'].toggle_favorite(listing_id)
     return jsonify({'success': True, 'favorited': new_status})
 
 
-@app.route('/stats')
+@bp.route('/stats')
 def stats():
     """Get current statistics."""
-    stats = db.get_stats()
-    return jsonify(stats)
+    stats = current_app.config['DB'].get_stats()
+
+    # Pollers sending back the ETag get an empty 304 while the counts are unchanged
+    response = jsonify(stats)
+    response.add_etag()
+    return response.make_conditional(request)
 
 
 def run_web_ui(host='127.0.0.1', port=5000, debug=True):
@@ -131,7 +163,7 @@ def run_web_ui(host='127.0.0.1', port=5000, debug=True):
     print("Press Ctrl+C to stop")
     print()
 
-    app.run(host=host, port=port, debug=debug)
+    create_app().run(host=host, port=port, debug=debug)
 
 
 if __name__ == '__main__':
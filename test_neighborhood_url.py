@@ -2,67 +2,108 @@
 Test neighborhood URL to see what's actually being returned.
 """
 
+import argparse
+import os
+
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
-import time
-
-# Test URL with Lincoln Park
-test_url = "https://www.apartments.com/chicago-il/lincoln-park/3-to-5-bedrooms/?min-1500-max-4500"
-
-print("Testing URL:", test_url)
-print("=" * 80)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+import re
+
+# Wait for listings to render rather than sleeping a fixed 5 seconds
+READY_SELECTOR = 'article.placard, [data-listingid]'
+READY_TIMEOUT = 10
+
+# Listing selectors to count, compiled once
+SELECTORS_TO_TRY = [
+    'article.placard',
+    '[data-listingid]',
+    'li.mortar-wrapper',
+    '.property-information',
+    '[class*="property"]'
+]
+COMPILED_SELECTORS = [(selector, CSSSelector(selector)) for selector in SELECTORS_TO_TRY]
+
+# First text node mentioning an empty result set, matched case-insensitively
+_UPPER = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_LOWER = 'abcdefghijklmnopqrstuvwxyz'
+NO_RESULTS_TEXT = etree.XPath(
+    f"(//text()[contains(translate(., '{_UPPER}', '{_LOWER}'), 'no results')"
+    f" or contains(translate(., '{_UPPER}', '{_LOWER}'), 'no apartments')"
+    f" or contains(translate(., '{_UPPER}', '{_LOWER}'), 'did not match')])[1]"
+)
+
+# Page text as BeautifulSoup's get_text() sees it: no script, style or template contents
+VISIBLE_TEXT = etree.XPath(
+    "//text()[not(parent::script or parent::style or ancestor::template)]"
+)
+
+# Error keywords to flag in the page text, in report order
+ERROR_KEYWORDS = ['404', 'not found', 'error', 'invalid']
+ERROR_KEYWORDS_RE = re.compile('|'.join(map(re.escape, ERROR_KEYWORDS)), re.IGNORECASE)
+
+# Neighborhoods to check, all with the same bedroom and price filters
+DEFAULT_NEIGHBORHOODS = ['lincoln-park']
+URL_TEMPLATE = "https://www.apartments.com/chicago-il/{}/3-to-5-bedrooms/?min-1500-max-4500"
+
+parser = argparse.ArgumentParser(description=__doc__.strip())
+parser.add_argument('neighborhoods', nargs='*', default=DEFAULT_NEIGHBORHOODS,
+                    help="Neighborhood URL slugs to check (default: lincoln-park)")
+parser.add_argument('--debugger-address', default=os.environ.get('CHROME_DEBUGGER_ADDRESS'),
+                    help="Attach to a Chrome already started with --remote-debugging-port, "
+                         "e.g. localhost:9222, instead of launching a new one")
+args = parser.parse_args()
+
+
+def inspect_page(driver, test_url: str, html_path: str):
+    """Load one URL in the shared driver and report what came back."""
+    print("Testing URL:", test_url)
+    print("=" * 80)
 
-# Setup Selenium
-chrome_options = Options()
-chrome_options.add_argument('--headless')
-chrome_options.add_argument('--no-sandbox')
-chrome_options.add_argument('--disable-dev-shm-usage')
-
-driver = webdriver.Chrome(options=chrome_options)
-
-try:
     driver.get(test_url)
-    time.sleep(5)
+    try:
+        WebDriverWait(driver, READY_TIMEOUT).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, READY_SELECTOR))
+        )
+    except TimeoutException:
+        print(f"⚠️  No '{READY_SELECTOR}' after {READY_TIMEOUT}s, inspecting page as loaded")
+        print()
 
     html = driver.page_source
-    soup = BeautifulSoup(html, 'lxml')
+    doc = lxml.html.document_fromstring(html)
 
     print(f"Page loaded: {len(html):,} characters")
     print()
 
     # Check title
-    title = soup.find('title')
-    print(f"Page title: {title.get_text() if title else 'None'}")
+    title = doc.find('.//title')
+    print(f"Page title: {title.text_content() if title is not None else 'None'}")
     print()
 
     # Check for "no results" message
-    no_results = soup.find(string=lambda text: text and ('no results' in text.lower() or 'no apartments' in text.lower() or 'did not match' in text.lower()))
+    no_results = NO_RESULTS_TEXT(doc)
     if no_results:
         print("❌ 'No results' message found!")
-        print(f"   Message: {no_results.strip()}")
+        print(f"   Message: {no_results[0].strip()}")
         print()
 
     # Check for listings
-    selectors_to_try = [
-        'article.placard',
-        '[data-listingid]',
-        'li.mortar-wrapper',
-        '.property-information',
-        '[class*="property"]'
-    ]
-
     print("Checking selectors:")
-    for selector in selectors_to_try:
-        elements = soup.select(selector)
+    for selector, compiled in COMPILED_SELECTORS:
+        elements = compiled(doc)
         print(f"  {selector:<30} → {len(elements)} elements")
-
     print()
 
     # Save HTML for inspection
-    with open('test_neighborhood_page.html', 'w') as f:
+    with open(html_path, 'w') as f:
         f.write(html)
-    print("✓ Saved HTML to: test_neighborhood_page.html")
+    print(f"✓ Saved HTML to: {html_path}")
 
     # Look for redirect or error messages
     print()
@@ -74,15 +115,40 @@ try:
         print(f"⚠️  Page redirected to: {current_url}")
 
     # Check for error messages
-    error_keywords = ['404', 'not found', 'error', 'invalid']
-    body_text = soup.get_text().lower()
-    for keyword in error_keywords:
-        if keyword in body_text:
+    found = {match.lower() for match in ERROR_KEYWORDS_RE.findall(''.join(VISIBLE_TEXT(doc)))}
+    for keyword in ERROR_KEYWORDS:
+        if keyword in found:
             print(f"⚠️  Found '{keyword}' in page text")
 
-finally:
-    driver.quit()
+    print()
+    print("=" * 80)
+    print(f"Check {html_path} to see what was returned")
+
+
+# Setup Selenium: one browser for every neighborhood
+chrome_options = Options()
+if args.debugger_address:
+    # Reuse a long-lived Chrome, e.g. one started with
+    #   google-chrome --headless --remote-debugging-port=9222 --user-data-dir=/tmp/chr
+    chrome_options.debugger_address = args.debugger_address
+else:
+    chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
 
-print()
-print("=" * 80)
-print("Check test_neighborhood_page.html to see what was returned")
+driver = webdriver.Chrome(options=chrome_options)
+
+try:
+    for i, neighborhood in enumerate(args.neighborhoods):
+        if i:
+            print()
+        html_path = ('test_neighborhood_page.html' if len(args.neighborhoods) == 1
+                     else f'test_neighborhood_page_{neighborhood}.html')
+        inspect_page(driver, URL_TEMPLATE.format(neighborhood), html_path)
+
+finally:
+    if args.debugger_address:
+        # Leave the attached browser running for the next run
+        driver.service.stop()
+    else:
+        driver.quit()